@@ -2,13 +2,17 @@
 
 Usage:
     specdrift analyze --spec <path> --endpoint <url> --path <api_path>
+    specdrift analyze-batch --spec <path> --endpoint <url> --targets <file>
 """
 
 import asyncio
 import json
 import logging
 import sys
+import tomllib
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import Any
 
 import typer
 from rich.console import Console
@@ -16,7 +20,10 @@ from rich.logging import RichHandler
 from rich.panel import Panel
 from rich.table import Table
 
-from specdrift.types import DecisionType, DriftReport, HttpMethod
+from specdrift import jsonutil
+from specdrift.modules.diff_engine import DEFAULT_MAX_ANOMALIES
+from specdrift.modules.spec_cache import DEFAULT_CACHE_DIR
+from specdrift.types import AnalysisTarget, DecisionType, DriftReport, HttpMethod, HttpTransport
 
 console = Console()
 app = typer.Typer(
@@ -90,6 +97,37 @@ def analyze(
         "-j",
         help="Output results as JSON",
     ),
+    output_jsonl: bool = typer.Option(
+        False,
+        "--jsonl",
+        help="Stream results as JSON Lines, one anomaly per line",
+    ),
+    cache_dir: Path = typer.Option(
+        DEFAULT_CACHE_DIR,
+        "--cache-dir",
+        help="Directory for caching parsed specs between runs",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Always re-parse the spec instead of using the cache",
+    ),
+    cache_llm: bool = typer.Option(
+        False,
+        "--cache-llm",
+        help="Reuse cached LLM decisions for identical drift (stored in the cache directory)",
+    ),
+    transport: HttpTransport = typer.Option(
+        HttpTransport.HTTPX,
+        "--transport",
+        help="HTTP transport (aiohttp needs the 'aiohttp' extra)",
+    ),
+    max_anomalies: int = typer.Option(
+        DEFAULT_MAX_ANOMALIES,
+        "--max-anomalies",
+        min=1,
+        help="Stop analyzing a response after this many anomalies",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -99,6 +137,7 @@ def analyze(
 ) -> None:
     """Analyze an API endpoint for spec drift."""
     from specdrift.modules.pipeline import analyze_endpoint
+    from specdrift.modules.request_executor import create_http_client
     
     # Set up logging
     setup_logging(verbose=verbose)
@@ -112,19 +151,27 @@ def analyze(
     console.print(f"\n[bold]Analyzing:[/bold] {method.upper()} {endpoint}{path}")
     console.print(f"[bold]Spec:[/bold] {spec}\n")
     
-    try:
-        report = asyncio.run(
-            analyze_endpoint(
+    async def run() -> DriftReport:
+        async with create_http_client(transport=transport) as client:
+            return await analyze_endpoint(
                 spec_path=str(spec),
                 endpoint_url=endpoint,
                 path=path,
                 method=http_method,
                 expected_status=status,
                 auth_token=auth_token,
+                spec_cache_dir=None if no_cache else cache_dir,
+                client=client,
+                max_anomalies=max_anomalies,
+                llm_cache_dir=cache_dir if cache_llm else None,
             )
-        )
+    
+    try:
+        report = asyncio.run(run())
         
-        if output_json:
+        if output_jsonl:
+            _output_jsonl(report)
+        elif output_json:
             _output_json(report)
         else:
             _output_rich(report)
@@ -138,9 +185,268 @@ def analyze(
         raise typer.Exit(2)
 
 
+@app.command()
+def analyze_batch(
+    spec: Path = typer.Option(
+        ...,
+        "--spec",
+        "-s",
+        help="Path to OpenAPI spec file (YAML or JSON)",
+        exists=True,
+    ),
+    endpoint: str = typer.Option(
+        ...,
+        "--endpoint",
+        "-e",
+        help="Base URL of the API to test",
+    ),
+    targets_file: Path = typer.Option(
+        None,
+        "--targets",
+        "-t",
+        help="JSON or TOML file listing the paths to analyze "
+        "(default: every GET endpoint that takes no parameters)",
+        exists=True,
+    ),
+    concurrency: int = typer.Option(
+        20,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Maximum number of endpoints analyzed at once",
+    ),
+    auth_token: str = typer.Option(
+        None,
+        "--auth",
+        "-a",
+        help="Bearer auth token",
+    ),
+    output_json: bool = typer.Option(
+        False,
+        "--json",
+        "-j",
+        help="Output results as JSON",
+    ),
+    output_jsonl: bool = typer.Option(
+        False,
+        "--jsonl",
+        help="Stream results as JSON Lines, one anomaly per line",
+    ),
+    cache_dir: Path = typer.Option(
+        DEFAULT_CACHE_DIR,
+        "--cache-dir",
+        help="Directory for caching parsed specs between runs",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Always re-parse the spec instead of using the cache",
+    ),
+    cache_llm: bool = typer.Option(
+        False,
+        "--cache-llm",
+        help="Reuse cached LLM decisions for identical drift (stored in the cache directory)",
+    ),
+    transport: HttpTransport = typer.Option(
+        HttpTransport.HTTPX,
+        "--transport",
+        help="HTTP transport (aiohttp needs the 'aiohttp' extra)",
+    ),
+    max_anomalies: int = typer.Option(
+        DEFAULT_MAX_ANOMALIES,
+        "--max-anomalies",
+        min=1,
+        help="Stop analyzing a response after this many anomalies",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Enable verbose logging",
+    ),
+) -> None:
+    """Analyze several API endpoints concurrently.
+    
+    The targets file holds a list of {"path", "method", "status"} entries,
+    either as a JSON array or as [[targets]] tables in TOML. Without one,
+    every GET endpoint that takes no parameters is analyzed.
+    """
+    from specdrift.modules.openapi_parser import load_spec_from_file
+    from specdrift.modules.pipeline import analyze_endpoints, spec_targets
+    from specdrift.modules.request_executor import create_http_client
+    
+    # Set up logging
+    setup_logging(verbose=verbose)
+    
+    if targets_file is None:
+        try:
+            parsed_spec = load_spec_from_file(str(spec), None if no_cache else cache_dir)
+        except Exception as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(2)
+        targets = spec_targets(parsed_spec)
+    else:
+        try:
+            targets = _load_targets(targets_file)
+        except (ValueError, tomllib.TOMLDecodeError) as e:
+            console.print(f"[red]Invalid targets file:[/red] {e}")
+            raise typer.Exit(2)
+    
+    console.print(f"\n[bold]Analyzing:[/bold] {len(targets)} endpoints on {endpoint}")
+    console.print(f"[bold]Spec:[/bold] {spec}\n")
+    
+    async def run() -> list[DriftReport | Exception]:
+        async with create_http_client(transport=transport) as client:
+            return await analyze_endpoints(
+                spec_path=str(spec),
+                endpoint_url=endpoint,
+                targets=targets,
+                concurrency=concurrency,
+                auth_token=auth_token,
+                spec_cache_dir=None if no_cache else cache_dir,
+                client=client,
+                max_anomalies=max_anomalies,
+                llm_cache_dir=cache_dir if cache_llm else None,
+            )
+    
+    try:
+        results = asyncio.run(run())
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(2)
+    
+    if output_jsonl:
+        _write_stdout(
+            line
+            for target, result in zip(targets, results)
+            for line in _jsonl_lines(target, result)
+        )
+    elif output_json:
+        _output_batch_json(targets, results)
+    else:
+        _output_batch_rich(targets, results)
+    
+    # Errors take precedence over drift in the exit code
+    if any(isinstance(result, Exception) for result in results):
+        raise typer.Exit(2)
+    if any(isinstance(result, DriftReport) and result.has_drift for result in results):
+        raise typer.Exit(1)
+
+
+def _load_targets(targets_file: Path) -> list[AnalysisTarget]:
+    """Load batch targets from a JSON or TOML file."""
+    content = targets_file.read_text(encoding="utf-8")
+    data: Any
+    if targets_file.suffix.lower() == ".toml":
+        data = tomllib.loads(content).get("targets", [])
+    else:
+        data = jsonutil.loads(content)
+        if isinstance(data, dict):
+            data = data.get("targets", [])
+    
+    if not isinstance(data, list):
+        raise ValueError("expected a list of targets")
+    
+    targets = []
+    for entry in data:
+        if not isinstance(entry, dict):
+            raise ValueError(f"target must be an object, got {entry!r}")
+        if isinstance(entry.get("method"), str):
+            entry = {**entry, "method": entry["method"].upper()}
+        targets.append(AnalysisTarget.model_validate(entry))
+    return targets
+
+
+def _output_batch_json(
+    targets: list[AnalysisTarget],
+    results: list[DriftReport | Exception],
+) -> None:
+    """Output batch results as a JSON array."""
+    entries = []
+    for target, result in zip(targets, results):
+        if isinstance(result, Exception):
+            entries.append({
+                "endpoint": f"{target.method.value} {target.path}",
+                "error": str(result),
+            })
+        else:
+            entries.append(result.model_dump(mode="json"))
+    _write_stdout([jsonutil.dumps(entries, indent=True) + b"\n"])
+
+
+def _output_batch_rich(
+    targets: list[AnalysisTarget],
+    results: list[DriftReport | Exception],
+) -> None:
+    """Output a one-row-per-endpoint summary table."""
+    table = Table(title=f"Batch Results ({len(targets)} endpoints)")
+    table.add_column("Endpoint")
+    table.add_column("Result")
+    table.add_column("Anomalies")
+    
+    for target, result in zip(targets, results):
+        endpoint = f"{target.method.value} {target.path}"
+        if isinstance(result, Exception):
+            table.add_row(endpoint, f"[red]Error: {result}[/red]", "-")
+        elif not result.has_drift:
+            table.add_row(endpoint, "[green]No drift[/green]", "0")
+        else:
+            decision = result.llm_decision.decision.value if result.llm_decision else "DRIFT"
+            total = result.anomaly_summary.total_anomalies if result.anomaly_summary else 0
+            table.add_row(endpoint, f"[yellow]{decision}[/yellow]", str(total))
+    
+    console.print(table)
+
+
 def _output_json(report: DriftReport) -> None:
     """Output report as JSON."""
-    print(report.model_dump_json(indent=2))
+    _write_stdout([jsonutil.dumps(report.model_dump(mode="json"), indent=True) + b"\n"])
+
+
+def _output_jsonl(report: DriftReport) -> None:
+    """Stream report as JSON Lines.
+    
+    The first line is the report without its anomaly list, followed by
+    one {"anomaly": ...} line per anomaly. Lines are encoded one at a
+    time, so memory use does not grow with the number of anomalies.
+    """
+    _write_stdout(_jsonl_lines(None, report))
+
+
+def _jsonl_lines(
+    target: AnalysisTarget | None,
+    result: DriftReport | Exception,
+) -> Iterator[bytes]:
+    """Encode one analysis result as JSON Lines."""
+    if isinstance(result, Exception):
+        endpoint = f"{target.method.value} {target.path}" if target else None
+        yield jsonutil.dumps({"endpoint": endpoint, "error": str(result)}) + b"\n"
+        return
+    
+    header = result.model_dump(mode="json", exclude={"anomaly_summary": {"anomalies"}})
+    yield jsonutil.dumps(header) + b"\n"
+    if result.anomaly_summary:
+        for anomaly in result.anomaly_summary.anomalies:
+            yield jsonutil.dumps({"anomaly": anomaly.as_dict()}) + b"\n"
+
+
+def _write_stdout(chunks: Iterable[bytes]) -> None:
+    """Write encoded output to stdout.
+    
+    The bytes go straight to stdout's binary buffer, skipping the text
+    layer's decode/re-encode round trip.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # Text-only stream (e.g. redirected in tests)
+        for chunk in chunks:
+            sys.stdout.write(chunk.decode())
+        return
+    # Flush pending text output so it stays ahead of the raw bytes
+    sys.stdout.flush()
+    for chunk in chunks:
+        buffer.write(chunk)
+    buffer.flush()
 
 
 def _output_rich(report: DriftReport) -> None:
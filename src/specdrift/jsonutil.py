@@ -0,0 +1,145 @@
+"""JSON encoding helpers.
+
+Uses orjson (the optional ``fast`` extra) when it is installed and falls
+back to the standard library otherwise. Both paths produce UTF-8 bytes.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_ORJSON = False
+
+
+def loads(data: bytes | bytearray | str) -> Any:
+    """Decode a JSON document.
+
+    Args:
+        data: Raw JSON as bytes or text.
+
+    Returns:
+        The decoded Python object.
+
+    Raises:
+        ValueError: If the document is not valid JSON.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Encode an object as JSON.
+
+    Args:
+        obj: JSON-compatible object. Non-string dict keys (e.g. integer
+            status codes from YAML specs) are converted to strings.
+        indent: Pretty-print with two-space indentation.
+
+    Returns:
+        UTF-8 encoded JSON.
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def canonical(obj: Any) -> bytes:
+    """Encode plain JSON data canonically, with object keys sorted.
+
+    Equal data encodes to equal bytes, so the result can key caches by
+    content. As in clone(), values JSON cannot represent are rejected
+    rather than converted (with orjson, NaN and infinite floats still
+    become null).
+
+    Args:
+        obj: JSON-compatible object.
+
+    Returns:
+        UTF-8 encoded compact JSON.
+
+    Raises:
+        TypeError, ValueError: If obj is not plain JSON data, or is
+            circular.
+    """
+    if HAS_ORJSON:
+        option = (
+            orjson.OPT_SORT_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        return orjson.dumps(obj, option=option)
+    return json.dumps(
+        obj, sort_keys=True, allow_nan=False, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+def fingerprint(obj: Any) -> bytes:
+    """Encode plain JSON data exactly, to key caches by content.
+
+    Unlike canonical(), object keys keep their order, and data that JSON
+    would not give back unchanged is rejected: NaN and infinite floats
+    and, with orjson, subclasses of the JSON types. Tuples still encode
+    like lists.
+
+    Args:
+        obj: JSON-compatible object.
+
+    Returns:
+        UTF-8 encoded compact JSON.
+
+    Raises:
+        TypeError, ValueError: If obj is not plain JSON data, or is
+            circular.
+    """
+    if HAS_ORJSON:
+        option = (
+            orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_SUBCLASS
+        )
+        encoded = orjson.dumps(obj, option=option)
+        if b"null" in encoded:
+            # orjson writes NaN and infinite floats as null; the standard
+            # encoder rejects them
+            json.dumps(obj, allow_nan=False)
+        return encoded
+    return json.dumps(
+        obj, allow_nan=False, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+def clone(obj: Any) -> Any:
+    """Deep-copy plain JSON data by encoding and decoding it with orjson.
+
+    Much faster than a Python-level copy for large documents. Non-string
+    dict keys and values JSON cannot represent (datetimes, subclasses of
+    dict or str) are rejected rather than converted. NaN and infinite
+    floats do become null, so only use this for data known to be JSON.
+
+    Args:
+        obj: JSON-compatible object.
+
+    Returns:
+        An independent copy of obj.
+
+    Raises:
+        TypeError: If obj is not plain JSON data, or orjson is not installed.
+    """
+    if not HAS_ORJSON:
+        raise TypeError("jsonutil.clone() requires orjson")
+    option = (
+        orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+    return orjson.loads(orjson.dumps(obj, option=option))
@@ -4,63 +4,174 @@ This module compares API responses against OpenAPI schemas WITHOUT using any LLM
 All comparisons are purely deterministic.
 """
 
+import hashlib
+from collections import Counter
+from collections.abc import Collection
 from typing import Any
 
+from specdrift import jsonutil
 from specdrift.types import Anomaly, AnomalySummary, AnomalyType
 
-from .detectors.additional_detector import detect_additional_fields
-from .detectors.enum_detector import detect_enum_violations
-from .detectors.required_detector import detect_missing_required
+from .codegen import build_validator, check_value
+from .compile import SchemaNode, _remember, compile_schema, get_compiled
 from .detectors.status_detector import detect_status_mismatch
-from .detectors.type_detector import detect_type_mismatches
+
+# Default cap on anomalies collected per response. A response that is
+# wildly off-spec stops being traversed once this many are found.
+DEFAULT_MAX_ANOMALIES = 500
+
+# Maximum number of (schema, response body) results kept for callers
+# that opt into memoization
+RESULT_CACHE_SIZE = 1024
+
+
+class CompiledSchema:
+    """A response schema prepared once for validating many responses.
+    
+    Holds the compiled schema and the documented status codes, so
+    callers validating responses of one operation repeatedly do no
+    per-call schema lookup at all.
+    
+    Example:
+        compiled = CompiledSchema(schema, frozenset({200, 404}))
+        for body, status in responses:
+            anomalies = compiled.validate(body, status)
+    """
+
+    __slots__ = ("node", "expected_status_codes", "max_anomalies", "memoize")
+
+    def __init__(
+        self,
+        schema: dict[str, Any] | SchemaNode | None,
+        expected_status_codes: Collection[int] | None = None,
+        max_anomalies: int | None = DEFAULT_MAX_ANOMALIES,
+        memoize: bool = False,
+    ) -> None:
+        """Prepare a schema for validation.
+        
+        Args:
+            schema: The OpenAPI schema for the expected response, raw or
+                compiled with compile_schema(). Empty or None skips body
+                validation.
+            expected_status_codes: Documented status codes, ideally a
+                frozenset.
+            max_anomalies: Stop analyzing after this many anomalies
+                (None for no limit).
+            memoize: Reuse the anomalies found for an identical response
+                body (by content) instead of validating it again. Worth
+                it when the same payloads recur, e.g. retried webhooks.
+        """
+        if isinstance(schema, SchemaNode):
+            self.node: SchemaNode | None = schema
+        else:
+            self.node = get_compiled(schema) if schema else None
+        self.expected_status_codes = expected_status_codes
+        self.max_anomalies = max_anomalies
+        self.memoize = memoize
+
+    def validate(self, response_body: Any, response_status: int) -> list[Anomaly]:
+        """Validate one response.
+        
+        Args:
+            response_body: The actual response body from the API.
+            response_status: The HTTP status code received.
+            
+        Returns:
+            List of detected anomalies, at most max_anomalies long.
+        """
+        anomalies: list[Anomaly] = []
+        
+        # Detect status code mismatches
+        if self.expected_status_codes:
+            anomalies.extend(detect_status_mismatch(response_status, self.expected_status_codes))
+        
+        # Only validate body against schema if we have a schema
+        if self.node is not None and response_body is not None:
+            if self.memoize:
+                anomalies.extend(self._memoized_body_anomalies(self.node, response_body))
+                if self.max_anomalies is not None:
+                    del anomalies[self.max_anomalies:]
+            else:
+                # Type, required, additional and enum checks in one traversal
+                check_value(response_body, self.node, "$", anomalies, limit=self.max_anomalies)
+        
+        return anomalies
+
+    def _memoized_body_anomalies(self, node: SchemaNode, response_body: Any) -> list[Anomaly]:
+        """Get the body's anomalies from the result cache, validating on a miss.
+        
+        Bodies are keyed by a digest of their exact JSON encoding, which
+        orjson produces far faster than the validation it saves. Key order
+        is kept, since it decides the order anomalies are reported in.
+        Bodies that are not plain JSON (NaN included) are validated every
+        time. Callers get their own copies of cached anomalies.
+        """
+        body_anomalies: list[Anomaly] = []
+        try:
+            encoded = jsonutil.fingerprint(response_body)
+        except (TypeError, ValueError):
+            check_value(response_body, node, "$", body_anomalies, limit=self.max_anomalies)
+            return body_anomalies
+        
+        digest = hashlib.blake2b(encoded, digest_size=16).digest()
+        key = (id(node), self.max_anomalies, digest)
+        entry = _result_cache.get(key)
+        if entry is not None and entry[0] is node:
+            return _copy_anomalies(entry[1])
+        
+        check_value(response_body, node, "$", body_anomalies, limit=self.max_anomalies)
+        _remember(
+            _result_cache, key, (node, _copy_anomalies(body_anomalies)), RESULT_CACHE_SIZE
+        )
+        return body_anomalies
+
+
+def _copy_anomalies(anomalies: list[Anomaly]) -> list[Anomaly]:
+    """Copy anomalies, so a cached result is never handed out to be mutated."""
+    return [
+        Anomaly(
+            anomaly.anomaly_type,
+            anomaly.json_path,
+            anomaly.expected,
+            anomaly.actual,
+            anomaly.message_template,
+            anomaly.message_args,
+        )
+        for anomaly in anomalies
+    ]
 
 
 def compare_response_to_schema(
     response_body: Any,
     response_status: int,
-    schema: dict[str, Any],
-    expected_status_codes: list[int] | None = None,
+    schema: dict[str, Any] | SchemaNode,
+    expected_status_codes: Collection[int] | None = None,
+    max_anomalies: int | None = DEFAULT_MAX_ANOMALIES,
+    memoize: bool = False,
 ) -> list[Anomaly]:
     """Compare an API response against an OpenAPI schema.
     
     This is the main entry point for the diff engine.
-    NO LLM is used - all comparisons are deterministic.
+    NO LLM is used - all comparisons are deterministic. Compiled schemas
+    are cached, so repeated calls with one schema compile it once; use
+    CompiledSchema to also skip the per-call cache lookup.
     
     Args:
         response_body: The actual response body from the API.
         response_status: The HTTP status code received.
-        schema: The OpenAPI schema for the expected response.
-        expected_status_codes: List of documented status codes.
+        schema: The OpenAPI schema for the expected response, either raw
+            or already compiled with compile_schema().
+        expected_status_codes: Documented status codes, ideally a frozenset.
+        max_anomalies: Stop analyzing after this many anomalies
+            (None for no limit).
+        memoize: Reuse the anomalies found for an identical response body;
+            see CompiledSchema.
         
     Returns:
-        List of detected anomalies.
+        List of detected anomalies, at most max_anomalies long.
     """
-    anomalies: list[Anomaly] = []
-    
-    # Detect status code mismatches
-    if expected_status_codes:
-        status_anomalies = detect_status_mismatch(response_status, expected_status_codes)
-        anomalies.extend(status_anomalies)
-    
-    # Only validate body against schema if we have a schema
-    if schema and response_body is not None:
-        # Detect type mismatches
-        type_anomalies = detect_type_mismatches(response_body, schema, "$")
-        anomalies.extend(type_anomalies)
-        
-        # Detect missing required fields
-        required_anomalies = detect_missing_required(response_body, schema, "$")
-        anomalies.extend(required_anomalies)
-        
-        # Detect additional undocumented fields
-        additional_anomalies = detect_additional_fields(response_body, schema, "$")
-        anomalies.extend(additional_anomalies)
-        
-        # Detect enum violations
-        enum_anomalies = detect_enum_violations(response_body, schema, "$")
-        anomalies.extend(enum_anomalies)
-    
-    return anomalies
+    compiled = CompiledSchema(schema, expected_status_codes, max_anomalies, memoize)
+    return compiled.validate(response_body, response_status)
 
 
 def summarize_anomalies(
@@ -77,9 +188,7 @@ def summarize_anomalies(
         AnomalySummary suitable for LLM prompts.
     """
     # Count by type
-    by_type: dict[AnomalyType, int] = {}
-    for anomaly in anomalies:
-        by_type[anomaly.anomaly_type] = by_type.get(anomaly.anomaly_type, 0) + 1
+    by_type: Counter[AnomalyType] = Counter(anomaly.anomaly_type for anomaly in anomalies)
     
     return AnomalySummary(
         total_anomalies=len(anomalies),
@@ -89,7 +198,15 @@ def summarize_anomalies(
     )
 
 
+_result_cache: dict[tuple[int, int | None, bytes], tuple[SchemaNode, list[Anomaly]]] = {}
+
+
 __all__ = [
+    "DEFAULT_MAX_ANOMALIES",
+    "CompiledSchema",
+    "SchemaNode",
+    "build_validator",
     "compare_response_to_schema",
+    "compile_schema",
     "summarize_anomalies",
 ]
@@ -0,0 +1,213 @@
+"""Schema Compiler.
+
+Pre-compiles a raw OpenAPI schema dict into a tree of SchemaNode objects
+once, so the walker reads normalized fields instead of re-interpreting
+the schema with dict lookups at every visited node.
+"""
+
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+from specdrift import jsonutil
+
+# Mapping of OpenAPI types to Python types: the exact classes of the
+# decoded JSON values each type accepts. The one type-tag table, read for
+# SchemaNode.type_classes (the identity tests baked into generated
+# validators) and by the walker's subclass fallback.
+OPENAPI_TYPE_MAP: dict[str, tuple[type, ...]] = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+    "null": (type(None),),
+}
+
+# Reverse index: exact class of a decoded JSON value -> its OpenAPI type
+PY_TO_OPENAPI: dict[type, str] = {
+    str: "string",
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    list: "array",
+    dict: "object",
+    type(None): "null",
+}
+
+# OpenAPI types whose values are all hashable
+SCALAR_TYPES = frozenset({"string", "integer", "number", "boolean", "null"})
+
+# Maximum number of compiled schemas kept by get_compiled()
+COMPILED_CACHE_SIZE = 256
+
+
+@dataclass(slots=True, eq=False)
+class SchemaNode:
+    """A schema with its keywords resolved into walker-ready fields."""
+
+    # Raw "type" keyword, kept for anomaly reporting
+    schema_type: Any = None
+    # Accepted OpenAPI type names ("number" implies "integer"), or None
+    # when the schema declares no type
+    type_names: frozenset[str] | None = None
+    nullable: bool = False
+    # Whether a null value is a type mismatch: the node declares a type
+    # and is not nullable
+    rejects_null: bool = False
+    enum: list[Any] | None = None
+    # Enum values for membership tests: a frozenset, or a tuple when some
+    # value is unhashable. A set cannot hold an unhashable response value,
+    # so a TypeError from the set lookup means "not a member".
+    enum_members: frozenset[Any] | tuple[Any, ...] | None = None
+    required: tuple[str, ...] = ()
+    required_set: frozenset[str] = frozenset()
+    # Required fields whose own schema allows null
+    nullable_required: frozenset[str] = frozenset()
+    properties: dict[str, "SchemaNode"] = field(default_factory=dict)
+    items: "SchemaNode | None" = None
+    # Schema for fields not listed in properties, when additionalProperties
+    # declares one (map-style objects); such fields are documented
+    additional: "SchemaNode | None" = None
+    # Exact classes, other than NoneType, that pass the type check
+    type_classes: frozenset[type] = frozenset()
+    # For a scalar type: every class whose values pass the type (and null)
+    # check, so a whole array of such items can be checked at once
+    scalar_classes: frozenset[type] | None = None
+
+
+def compile_schema(schema: dict[str, Any]) -> SchemaNode:
+    """Compile an OpenAPI schema into a SchemaNode tree.
+
+    Args:
+        schema: The OpenAPI schema (with $refs already resolved).
+
+    Returns:
+        Root SchemaNode of the compiled tree.
+    """
+    return _compile(schema, {})
+
+
+def get_compiled(schema: dict[str, Any]) -> SchemaNode:
+    """Return the compiled form of a schema, compiling it on first use.
+
+    Entries are keyed by object identity, so a schema must not be mutated
+    after it has been compared against. The cache keeps a reference to
+    each schema, which stops its id from being reused while cached.
+    """
+    entry = _compiled_cache.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+
+    # An equal schema in a different dict (a re-parsed spec, a schema
+    # literal built per call) shares the node compiled for its content
+    key = _canonical_key(schema)
+    node = _content_cache.get(key) if key is not None else None
+    if node is None:
+        node = compile_schema(schema)
+        if key is not None:
+            _remember(_content_cache, key, node)
+    _remember(_compiled_cache, id(schema), (schema, node))
+    return node
+
+
+_compiled_cache: dict[int, tuple[dict[str, Any], SchemaNode]] = {}
+_content_cache: dict[bytes, SchemaNode] = {}
+# Guards updates of the bounded caches of the diff engine, which the
+# pipeline fills from worker threads as well as from the event loop.
+# Reentrant, so a caller holding it can still go through _remember().
+_cache_lock = threading.RLock()
+
+
+def _canonical_key(schema: dict[str, Any]) -> bytes | None:
+    """Key a schema by its content, or None when it is not plain JSON.
+
+    Serializing with sorted keys is a fraction of the cost of compiling,
+    and tells 1, 1.0, true and "1" apart. The cache keeps a 16-byte digest
+    of that text rather than the text itself, which is as large as the
+    schema. Recursive schemas cannot be serialized and are only cached
+    by identity.
+    """
+    try:
+        canonical = jsonutil.canonical(schema)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(canonical, digest_size=16).digest()
+
+
+def _remember(
+    cache: dict[Any, Any], key: Any, value: Any, size: int = COMPILED_CACHE_SIZE
+) -> None:
+    """Insert into a bounded cache, evicting its oldest entry when full."""
+    with _cache_lock:
+        if len(cache) >= size:
+            del cache[next(iter(cache))]
+        cache[key] = value
+
+
+def _compile(schema: Any, memo: dict[int, SchemaNode]) -> SchemaNode:
+    """Compile one schema node, sharing nodes for shared sub-schemas."""
+    if not isinstance(schema, dict):
+        return SchemaNode()
+
+    cached = memo.get(id(schema))
+    if cached is not None:
+        return cached
+
+    node = SchemaNode()
+    memo[id(schema)] = node
+
+    schema_type = schema.get("type")
+    if schema_type:
+        type_names = set(schema_type if isinstance(schema_type, list) else [schema_type])
+        if "number" in type_names:
+            type_names.add("integer")
+        node.schema_type = schema_type
+        node.type_names = frozenset(type_names)
+        node.nullable = "null" in type_names
+        node.type_classes = frozenset(
+            cls
+            for name in type_names
+            for cls in OPENAPI_TYPE_MAP.get(name, ())
+            if cls is not type(None)
+        )
+
+    if schema.get("nullable", False):
+        node.nullable = True
+    node.rejects_null = node.type_names is not None and not node.nullable
+
+    if "enum" in schema:
+        node.enum = schema["enum"]
+        try:
+            node.enum_members = frozenset(node.enum)
+        except TypeError:
+            node.enum_members = tuple(node.enum)
+
+    required = schema.get("required", ())
+    node.required = tuple(dict.fromkeys(required))
+    node.required_set = frozenset(node.required)
+
+    for prop_name, prop_schema in schema.get("properties", {}).items():
+        node.properties[prop_name] = _compile(prop_schema, memo)
+
+    node.nullable_required = frozenset(
+        name
+        for name in node.required
+        if name in node.properties and node.properties[name].nullable
+    )
+
+    if "items" in schema:
+        node.items = _compile(schema["items"], memo)
+
+    additional_properties = schema.get("additionalProperties")
+    if isinstance(additional_properties, dict):
+        node.additional = _compile(additional_properties, memo)
+
+    if node.type_names is not None and node.type_names <= SCALAR_TYPES:
+        node.scalar_classes = (
+            node.type_classes | {type(None)} if node.nullable else node.type_classes
+        )
+
+    return node
@@ -3,30 +3,40 @@
 Detects when the response status code is not documented in the spec.
 """
 
+from collections.abc import Collection
+
 from specdrift.types import Anomaly, AnomalyType
 
 
 def detect_status_mismatch(
     actual_status: int,
-    expected_status_codes: list[int],
+    expected_status_codes: Collection[int],
 ) -> list[Anomaly]:
     """Detect status code mismatches.
     
     Args:
         actual_status: The actual HTTP status code received.
-        expected_status_codes: List of documented status codes.
+        expected_status_codes: Documented status codes. A frozenset makes
+            the check a single hash lookup.
         
     Returns:
         List of status code mismatch anomalies (0 or 1 item).
     """
     if actual_status not in expected_status_codes:
+        # Sets are reported in a stable order
+        documented = (
+            expected_status_codes
+            if isinstance(expected_status_codes, list)
+            else sorted(expected_status_codes)
+        )
         return [
             Anomaly(
                 anomaly_type=AnomalyType.STATUS_CODE_MISMATCH,
                 json_path="$.status_code",
-                expected=f"One of: {expected_status_codes}",
+                expected=f"One of: {documented}",
                 actual=actual_status,
-                message=f"Status code {actual_status} is not documented. Expected one of: {expected_status_codes}",
+                message_template="Status code {} is not documented. Expected one of: {}",
+                message_args=(actual_status, documented),
             )
         ]
     return []
@@ -0,0 +1,259 @@
+"""Fused Schema Walker.
+
+Descends the (value, schema) tree exactly once and emits every body
+anomaly kind (type, required, additional, enum) inline, instead of
+running one recursive pass per detector.
+"""
+
+import sys
+from itertools import islice
+from typing import Any
+
+from specdrift.types import Anomaly, AnomalyType
+
+from .compile import OPENAPI_TYPE_MAP, PY_TO_OPENAPI, SchemaNode
+
+# A JSON path as a linked list of tuples: the root is a 1-tuple holding
+# its label, and each child is a (parent path, field name or array index)
+# pair, e.g. (((("$",), "items"), 3), "id") for "$.items[3].id". Extending
+# a path allocates one pair however deep it is.
+JsonPath = tuple[Any, ...]
+
+
+def walk(
+    value: Any,
+    node: SchemaNode,
+    path: JsonPath,
+    out: list[Anomaly],
+    limit: int | None = None,
+) -> None:
+    """Walk a value against its compiled schema, appending anomalies to ``out``.
+
+    Args:
+        value: The actual value from the response.
+        node: The compiled OpenAPI schema.
+        path: Current JSON path, rendered only when an anomaly is emitted.
+        out: Shared list that receives every detected anomaly.
+        limit: Stop once ``out`` holds this many anomalies. The last
+            visited node may overshoot it; callers trim if needed.
+    """
+    emit = out.append
+    # Explicit stack instead of recursion: no per-node frame setup, and no
+    # RecursionError on deeply nested responses. Children are pushed in
+    # reverse so they are visited (and reported) in document order.
+    stack: list[tuple[Any, SchemaNode, JsonPath]] = [(value, node, path)]
+    push = stack.append
+    pop = stack.pop
+    # Module globals used per node, bound once as locals
+    json_type_of = PY_TO_OPENAPI.get
+    conforming_scalars = _conforming_scalars
+    budget = sys.maxsize if limit is None else limit
+
+    while stack:
+        if len(out) >= budget:
+            break
+        value, node, path = pop()
+        # Handle nullable. A null still has to be one of the enum values.
+        if value is None:
+            if node.rejects_null:
+                emit(type_mismatch(render_path(path), node.schema_type, "null"))
+            enum = node.enum
+            if enum is not None and None not in node.enum_members:  # type: ignore[operator]
+                emit(enum_violation(render_path(path), enum, None))
+            continue
+        type_names = node.type_names
+
+        # Decoded JSON values are exactly these classes (never subclasses),
+        # so a pointer compare replaces isinstance's MRO walk
+        cls = value.__class__
+        json_type = json_type_of(cls)
+
+        # Type check. A mismatched value still gets the enum and object
+        # checks below, and its children are still visited.
+        if type_names is not None:
+            if json_type is not None:
+                type_matched = json_type in type_names
+            else:
+                type_matched = _matches_subclass(value, type_names)
+            if not type_matched:
+                emit(type_mismatch(render_path(path), node.schema_type, type(value).__name__))
+
+        # Enum check
+        enum = node.enum
+        if enum is not None:
+            try:
+                in_enum = value in node.enum_members  # type: ignore[operator]
+            except TypeError:
+                in_enum = False
+            if not in_enum:
+                emit(enum_violation(render_path(path), enum, value))
+
+        if cls is dict or (json_type is None and isinstance(value, dict)):
+            get_property = node.properties.get
+
+            # Required fields must be present: one C-level subset test on
+            # the happy path, a scan of the required list only on failure
+            required_set = node.required_set
+            if required_set and not value.keys() >= required_set:
+                rendered = render_path(path)
+                for field_name in node.required:
+                    if field_name not in value:
+                        emit(missing_field(rendered, field_name))
+
+            # Single pass over the response fields: flag null required and
+            # undocumented ones, push documented ones. Fields are walked in
+            # reverse so children pop off the stack in document order
+            # without a temporary list.
+            nullable_required = node.nullable_required
+            additional_node = node.additional
+            first_in_loop = len(out)
+            for field_name, field_value in reversed(value.items()):
+                prop_node = get_property(field_name, additional_node)
+                if prop_node is None:
+                    emit(additional_field(render_path(path), field_name, field_value))
+                else:
+                    push((field_value, prop_node, (path, field_name)))
+
+                # Emitted after the additional-field check so that, once the
+                # loop's anomalies are reversed, it reads first for the field
+                if (
+                    field_value is None
+                    and field_name in required_set
+                    and field_name not in nullable_required
+                ):
+                    emit(null_required(render_path(path), field_name))
+            if len(out) - first_in_loop > 1:
+                # Restore document order of the anomalies raised in the loop
+                out[first_in_loop:] = out[first_in_loop:][::-1]
+
+        elif cls is list or (json_type is None and isinstance(value, list)):
+            items_node = node.items
+            if items_node is not None and not conforming_scalars(value, items_node):
+                for i in range(len(value) - 1, -1, -1):
+                    push((value[i], items_node, (path, i)))
+
+
+# Anomaly constructors, shared with the generated validators in codegen.py.
+# ``rendered`` is the already-rendered path of the value (or, for field
+# anomalies, of the object holding the field).
+
+# Enum member lookups on the class go through the enum machinery; module
+# constants are plain global reads
+_TYPE_MISMATCH = AnomalyType.TYPE_MISMATCH
+_ENUM_VIOLATION = AnomalyType.ENUM_VIOLATION
+_MISSING_REQUIRED_FIELD = AnomalyType.MISSING_REQUIRED_FIELD
+_ADDITIONAL_FIELD = AnomalyType.ADDITIONAL_FIELD
+
+
+def type_mismatch(rendered: str, schema_type: Any, actual_type: str) -> Anomaly:
+    """Build a TYPE_MISMATCH anomaly."""
+    return Anomaly(
+        anomaly_type=_TYPE_MISMATCH,
+        json_path=rendered,
+        expected=schema_type,
+        actual=actual_type,
+        message_template="Expected {} but got {} at {}",
+        message_args=(schema_type, actual_type, rendered),
+    )
+
+
+def enum_violation(rendered: str, enum: list[Any], value: Any) -> Anomaly:
+    """Build an ENUM_VIOLATION anomaly."""
+    return Anomaly(
+        anomaly_type=_ENUM_VIOLATION,
+        json_path=rendered,
+        expected=f"One of: {enum}",
+        actual=value,
+        message_template="Value '{}' is not in allowed enum values {} at {}",
+        message_args=(value, enum, rendered),
+    )
+
+
+def missing_field(rendered: str, field_name: str) -> Anomaly:
+    """Build a MISSING_REQUIRED_FIELD anomaly for an absent field."""
+    return Anomaly(
+        anomaly_type=_MISSING_REQUIRED_FIELD,
+        json_path=f"{rendered}.{field_name}",
+        expected=f"Required field '{field_name}'",
+        actual="Field missing",
+        message_template="Required field '{}' is missing at {}",
+        message_args=(field_name, rendered),
+    )
+
+
+def null_required(rendered: str, field_name: str) -> Anomaly:
+    """Build a MISSING_REQUIRED_FIELD anomaly for a null required field."""
+    return Anomaly(
+        anomaly_type=_MISSING_REQUIRED_FIELD,
+        json_path=f"{rendered}.{field_name}",
+        expected=f"Non-null value for required field '{field_name}'",
+        actual="null",
+        message_template="Required field '{}' is null at {}",
+        message_args=(field_name, rendered),
+    )
+
+
+def additional_field(rendered: str, field_name: str, field_value: Any) -> Anomaly:
+    """Build an ADDITIONAL_FIELD anomaly."""
+    return Anomaly(
+        anomaly_type=_ADDITIONAL_FIELD,
+        json_path=f"{rendered}.{field_name}",
+        expected="Field not documented in schema",
+        actual=_summarize_value(field_value),
+        message_template="Undocumented field '{}' found at {}",
+        message_args=(field_name, rendered),
+    )
+
+
+def _conforming_scalars(items: list[Any], items_node: SchemaNode) -> bool:
+    """Whether every item passes a scalar items schema, checked in bulk.
+
+    One C-level pass over the item classes (and, for an enum, one subset
+    test) replaces visiting each item. False means some item may fail and
+    the items must be visited one by one.
+    """
+    scalar_classes = items_node.scalar_classes
+    if scalar_classes is None or not scalar_classes.issuperset(map(type, items)):
+        return False
+    enum_members = items_node.enum_members
+    if enum_members is None:
+        return True
+    return isinstance(enum_members, frozenset) and enum_members.issuperset(items)
+
+
+def _matches_subclass(value: Any, type_names: frozenset[str]) -> bool:
+    """Fallback type check for values that are not plain JSON classes."""
+    for type_name in type_names:
+        python_types = OPENAPI_TYPE_MAP.get(type_name)
+        if python_types and isinstance(value, python_types):
+            return not (type_name == "integer" and isinstance(value, bool))
+    return False
+
+
+def render_path(path: JsonPath) -> str:
+    """Render a linked path such as ((("$",), "items"), 3) as "$.items[3]"."""
+    parts = []
+    while len(path) == 2:
+        path, segment = path
+        parts.append(f"[{segment}]" if isinstance(segment, int) else f".{segment}")
+    parts.append(str(path[0]))
+    return "".join(reversed(parts))
+
+
+def _summarize_value(value: Any) -> str:
+    """Create a short summary of a value for reporting."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, str):
+        if len(value) > 50:
+            return f'"{value[:50]}..."'
+        return f'"{value}"'
+    if isinstance(value, list):
+        return f"array[{len(value)}]"
+    if isinstance(value, dict):
+        return f"object{{{', '.join(islice(value, 3))}}}"
+    return str(type(value).__name__)
@@ -4,18 +4,65 @@ Parses OpenAPI specs and extracts schemas for comparison.
 Handles $ref resolution and schema normalization.
 """
 
+import os
+import re
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 import yaml
 
+from specdrift import jsonutil
 from specdrift.types import HttpMethod, ParsedEndpoint, ParsedSpec
 
+from .spec_cache import load_cached_spec, store_cached_spec
 
-def parse_spec(spec: str | dict[str, Any]) -> ParsedSpec:
+# Prefer the libyaml-backed loader, which parses large specs several times faster
+try:
+    from yaml import CSafeLoader as SpecLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as SpecLoader  # type: ignore[assignment]
+
+# Operation keys of a path item
+_HTTP_METHODS = frozenset(("get", "post", "put", "patch", "delete", "head", "options"))
+
+# A document opening with "{" is almost always JSON
+_JSON_DOCUMENT = re.compile(r"\s*\{")
+
+
+def load_document(content: str, loader: type | None = None) -> Any:
+    """Parse a YAML or JSON spec document.
+    
+    JSON documents skip YAML entirely and go through the JSON decoder,
+    which is several times faster than even the libyaml loader.
+    
+    Args:
+        content: Raw document text.
+        loader: YAML loader class to use. When given, the document is
+            always parsed as YAML with it.
+        
+    Returns:
+        The parsed document.
+    """
+    if loader is None:
+        if _JSON_DOCUMENT.match(content):
+            try:
+                return jsonutil.loads(content)
+            except ValueError:
+                # A YAML flow mapping rather than JSON
+                pass
+        loader = SpecLoader
+    return yaml.load(content, Loader=loader)
+
+
+def parse_spec(spec: str | dict[str, Any], loader: type | None = None) -> ParsedSpec:
     """Parse an OpenAPI specification.
     
     Args:
         spec: OpenAPI spec as YAML/JSON string or already-parsed dict.
+        loader: Optional YAML loader class for string specs (see
+            load_document).
         
     Returns:
         ParsedSpec with extracted endpoints and schemas.
@@ -25,7 +72,7 @@ def parse_spec(spec: str | dict[str, Any]) -> ParsedSpec:
     """
     # Parse if string
     if isinstance(spec, str):
-        raw_spec = yaml.safe_load(spec)
+        raw_spec = load_document(spec, loader)
     else:
         raw_spec = spec
     
@@ -42,20 +89,26 @@ def parse_spec(spec: str | dict[str, Any]) -> ParsedSpec:
     # Extract components for ref resolution
     components = raw_spec.get("components", {})
     
-    # Parse endpoints
+    # Parse endpoints, resolving each $ref target only once per spec
     endpoints: list[ParsedEndpoint] = []
     paths = raw_spec.get("paths", {})
+    ref_cache: dict[str, dict[str, Any]] = {}
     
     for path, path_item in paths.items():
-        for method in ["get", "post", "put", "patch", "delete", "head", "options"]:
-            if method not in path_item:
+        # Walk the keys actually present rather than probing every method
+        for method in path_item:
+            if method not in _HTTP_METHODS:
+                # Path-level "parameters", "summary", extensions, ...
                 continue
             
             operation = path_item[method]
-            endpoint = _parse_operation(path, method, operation, raw_spec)
+            endpoint = _parse_operation(path, method, operation, raw_spec, ref_cache)
             endpoints.append(endpoint)
     
-    return ParsedSpec(
+    # The parser's output is already well-typed; constructing without
+    # validation also keeps the shared resolved schemas shared, where
+    # validating would shallow-copy every schema dict per endpoint
+    return ParsedSpec.model_construct(
         openapi_version=openapi_version,
         title=title,
         version=version,
@@ -70,6 +123,7 @@ def _parse_operation(
     method: str,
     operation: dict[str, Any],
     full_spec: dict[str, Any],
+    ref_cache: dict[str, dict[str, Any]] | None = None,
 ) -> ParsedEndpoint:
     """Parse a single operation (endpoint)."""
     # Get operation ID
@@ -80,79 +134,187 @@ def _parse_operation(
     
     # Parse request body schema
     request_schema = None
-    request_body = operation.get("requestBody", {})
-    if request_body:
-        content = request_body.get("content", {})
-        json_content = content.get("application/json", {})
-        if json_content:
-            schema = json_content.get("schema", {})
-            request_schema = resolve_refs(schema, full_spec)
+    json_content = _dig(operation, "requestBody", "content", "application/json")
+    if json_content:
+        schema = json_content.get("schema", {})
+        request_schema = resolve_refs(schema, full_spec, ref_cache)
     
-    # Parse response schemas
-    response_schemas: dict[int, dict[str, Any]] = {}
+    # Collect response schemas; each is resolved only when first read
+    raw_schemas: dict[int, dict[str, Any]] = {}
     responses = operation.get("responses", {})
     
     for status_code, response_def in responses.items():
-        try:
+        if isinstance(status_code, int):
+            # Unquoted YAML keys load as integers
+            code = status_code
+        elif status_code.isdecimal():
             code = int(status_code)
-        except ValueError:
-            # Handle 'default' or other non-numeric keys
+        else:
+            # Skip 'default' and range keys such as '2XX'
             continue
         
-        content = response_def.get("content", {})
-        json_content = content.get("application/json", {})
+        json_content = _dig(response_def, "content", "application/json")
         if json_content:
-            schema = json_content.get("schema", {})
-            response_schemas[code] = resolve_refs(schema, full_spec)
+            raw_schemas[code] = json_content.get("schema", {})
+    response_schemas = LazySchemas(raw_schemas, full_spec, ref_cache)
     
-    return ParsedEndpoint(
+    return ParsedEndpoint.model_construct(
         path=path,
         method=HttpMethod(method.upper()),
         operation_id=operation_id,
         request_schema=request_schema,
         response_schemas=response_schemas,
         parameters=parameters,
+        raw_operation=operation,
     )
 
 
-def resolve_refs(schema: dict[str, Any], full_spec: dict[str, Any]) -> dict[str, Any]:
+class LazySchemas(Mapping[int, dict[str, Any]]):
+    """Response schemas by status code, with $refs resolved on first access.
+    
+    A run only ever compares against one status code per endpoint, so
+    resolving every response of every operation up front is mostly wasted.
+    """
+    
+    __slots__ = ("_raw", "_resolved", "_full_spec", "_ref_cache")
+    
+    def __init__(
+        self,
+        raw: dict[int, dict[str, Any]],
+        full_spec: dict[str, Any],
+        ref_cache: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        self._raw = raw
+        self._resolved: dict[int, dict[str, Any]] = {}
+        self._full_spec = full_spec
+        self._ref_cache = {} if ref_cache is None else ref_cache
+    
+    def __getitem__(self, code: int) -> dict[str, Any]:
+        resolved = self._resolved.get(code)
+        if resolved is None:
+            resolved = self._resolved[code] = resolve_refs(
+                self._raw[code], self._full_spec, self._ref_cache
+            )
+        return resolved
+    
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._raw)
+    
+    def __len__(self) -> int:
+        return len(self._raw)
+
+
+def _dig(value: Any, *keys: str) -> Any:
+    """Follow a chain of keys into nested dicts.
+    
+    Returns:
+        The value at the end of the chain, or None if any key is missing.
+    """
+    # Keys are usually present, so indexing beats a chain of .get(key, {})
+    # calls that allocate a throwaway dict per missing level
+    try:
+        for key in keys:
+            value = value[key]
+    except (KeyError, TypeError):
+        return None
+    return value
+
+
+def resolve_refs(
+    schema: dict[str, Any],
+    full_spec: dict[str, Any],
+    cache: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, Any]:
     """Recursively resolve $ref references in a schema.
     
+    Each referenced schema is resolved once and then shared by every
+    place that references it. Parts of the schema that contain no $ref
+    are shared with the input rather than copied. A recursive reference resolves to the
+    enclosing result itself, so recursive schemas become cyclic dicts
+    instead of recursing forever.
+    
     Args:
         schema: Schema that may contain $ref references.
         full_spec: Full OpenAPI spec for resolving references.
+        cache: Resolved schemas by $ref path. Pass the same dict for
+            every schema of a spec to share work across them.
         
     Returns:
         Schema with all references resolved.
     """
+    if cache is None:
+        cache = {}
+    resolved: dict[str, Any] = _resolve_refs(schema, full_spec, cache, {})
+    return resolved
+
+
+def _resolve_refs(
+    schema: Any,
+    full_spec: dict[str, Any],
+    cache: dict[str, dict[str, Any]],
+    pending: dict[str, list[dict[str, Any]]],
+) -> Any:
+    """Resolve $refs in a schema; see resolve_refs().
+    
+    Args:
+        pending: $ref paths whose resolution is in progress, each with the
+            results of references to it that have sibling keys. Those are
+            filled in once the referenced schema is resolved.
+    """
     if not isinstance(schema, dict):
         return schema
     
     # Handle $ref
     if "$ref" in schema:
         ref_path = schema["$ref"]
-        resolved = _resolve_ref_path(ref_path, full_spec)
-        # Merge any additional properties from the original schema
-        result = resolve_refs(resolved, full_spec)
-        for key, value in schema.items():
-            if key != "$ref":
-                result[key] = value
-        return result
-    
-    # Recursively resolve in nested structures
-    resolved_schema: dict[str, Any] = {}
+        resolved = cache.get(ref_path)
+        if resolved is None:
+            # Register the result before descending into it, so references
+            # back to this schema find it instead of recursing
+            resolved = cache[ref_path] = {}
+            pending[ref_path] = []
+            target = _resolve_ref_path(ref_path, full_spec)
+            resolved.update(_resolve_refs(target, full_spec, cache, pending))
+            for result in pending.pop(ref_path):
+                siblings = dict(result)
+                result.clear()
+                result.update(resolved)
+                result.update(siblings)
+        if len(schema) == 1:
+            return resolved
+        # Merge any additional properties from the original schema into a
+        # copy, leaving the shared resolution untouched
+        result = {key: value for key, value in schema.items() if key != "$ref"}
+        waiting = pending.get(ref_path)
+        if waiting is not None:
+            # A recursive reference: the resolution is still empty
+            waiting.append(result)
+            return result
+        return {**resolved, **result}
+    
+    # Recursively resolve in nested structures. A subtree without any
+    # $ref is returned as it is rather than copied, so only the path down
+    # to each reference is rebuilt.
+    resolved_schema: dict[str, Any] | None = None
     for key, value in schema.items():
         if isinstance(value, dict):
-            resolved_schema[key] = resolve_refs(value, full_spec)
+            resolved_value: Any = _resolve_refs(value, full_spec, cache, pending)
         elif isinstance(value, list):
-            resolved_schema[key] = [
-                resolve_refs(item, full_spec) if isinstance(item, dict) else item
+            resolved_items = [
+                _resolve_refs(item, full_spec, cache, pending) if isinstance(item, dict) else item
                 for item in value
             ]
+            changed = any(new is not old for new, old in zip(resolved_items, value))
+            resolved_value = resolved_items if changed else value
         else:
-            resolved_schema[key] = value
+            continue
+        
+        if resolved_value is not value:
+            if resolved_schema is None:
+                resolved_schema = dict(schema)
+            resolved_schema[key] = resolved_value
     
-    return resolved_schema
+    return schema if resolved_schema is None else resolved_schema
 
 
 def _resolve_ref_path(ref_path: str, full_spec: dict[str, Any]) -> dict[str, Any]:
@@ -204,10 +366,10 @@ def get_endpoint_schema(
     Returns:
         Response schema if found, None otherwise.
     """
-    for endpoint in parsed_spec.endpoints:
-        if endpoint.method == method and _path_matches(path, endpoint.path):
-            return endpoint.response_schemas.get(status_code)
-    return None
+    endpoint = find_matching_endpoint(parsed_spec, path, method)
+    if endpoint is None:
+        return None
+    return endpoint.response_schemas.get(status_code)
 
 
 def find_matching_endpoint(
@@ -225,56 +387,134 @@ def find_matching_endpoint(
     Returns:
         Matching ParsedEndpoint or None.
     """
-    for endpoint in parsed_spec.endpoints:
-        if endpoint.method == method and _path_matches(path, endpoint.path):
+    # A concrete spec path matches before any templated one, as the
+    # OpenAPI spec requires; it is a single dict lookup
+    stripped = path.strip("/")
+    endpoint = _endpoints_by_key(parsed_spec).get((stripped, method))
+    if endpoint is not None:
+        return endpoint
+    
+    # Split once; only endpoints with the same method and segment count
+    # can match
+    actual_parts = stripped.split("/")
+    for endpoint in _endpoint_bucket(parsed_spec, method, len(actual_parts)):
+        if _path_matches(actual_parts, endpoint.path_segments):
             return endpoint
     return None
 
 
-def _path_matches(actual_path: str, spec_path: str) -> bool:
+def _endpoints_by_key(parsed_spec: ParsedSpec) -> dict[tuple[str, HttpMethod], ParsedEndpoint]:
+    """Get the endpoints keyed by (path without surrounding slashes, method).
+    
+    Built on first use; when two spec paths only differ in surrounding
+    slashes, the first one wins as in a linear scan.
+    """
+    by_key = parsed_spec._endpoints_by_key
+    if by_key is None:
+        by_key = {}
+        for endpoint in parsed_spec.endpoints:
+            by_key.setdefault((endpoint.path.strip("/"), endpoint.method), endpoint)
+        parsed_spec._endpoints_by_key = by_key
+    return by_key
+
+
+def _endpoint_bucket(
+    parsed_spec: ParsedSpec,
+    method: HttpMethod,
+    segment_count: int,
+) -> list[ParsedEndpoint]:
+    """Get the endpoints with a given method and path segment count.
+    
+    The index is built on first use; endpoints keep their spec order
+    within a bucket, so the first match is the same as a linear scan's.
+    """
+    index = parsed_spec._endpoint_index
+    if index is None:
+        index = {}
+        for endpoint in parsed_spec.endpoints:
+            key = (endpoint.method, len(endpoint.path_segments))
+            index.setdefault(key, []).append(endpoint)
+        parsed_spec._endpoint_index = index
+    return index.get((method, segment_count), [])
+
+
+def _path_matches(actual_parts: list[str], spec_segments: tuple[str | None, ...]) -> bool:
     """Check if an actual path matches a spec path pattern.
     
     Examples:
-        _path_matches("/users/123", "/users/{user_id}") -> True
-        _path_matches("/users/123/status", "/users/{user_id}/status") -> True
-        _path_matches("/users", "/users") -> True
-        _path_matches("/items", "/users") -> False
+        _path_matches(["users", "123"], ("users", None)) -> True
+        _path_matches(["users", "123", "status"], ("users", None, "status")) -> True
+        _path_matches(["users"], ("users",)) -> True
+        _path_matches(["items"], ("users",)) -> False
     
     Args:
-        actual_path: The actual path from the request (e.g., "/users/123").
-        spec_path: The OpenAPI spec path pattern (e.g., "/users/{user_id}").
+        actual_parts: Segments of the actual path (e.g., "/users/123").
+        spec_segments: ParsedEndpoint.path_segments of the spec path
+            pattern (e.g., "/users/{user_id}").
         
     Returns:
         True if the paths match.
     """
-    actual_parts = actual_path.strip("/").split("/")
-    spec_parts = spec_path.strip("/").split("/")
-    
     # Must have same number of segments
-    if len(actual_parts) != len(spec_parts):
+    if len(actual_parts) != len(spec_segments):
         return False
     
     # Check each segment
-    for actual_seg, spec_seg in zip(actual_parts, spec_parts):
-        # If spec segment is a parameter (e.g., {user_id}), it matches anything
-        if spec_seg.startswith("{") and spec_seg.endswith("}"):
-            continue
-        # Otherwise must match exactly
-        if actual_seg != spec_seg:
+    for actual_seg, spec_seg in zip(actual_parts, spec_segments):
+        # A parameter segment (None) matches anything; literals must match
+        if spec_seg is not None and actual_seg != spec_seg:
             return False
     
     return True
 
 
-def load_spec_from_file(file_path: str) -> ParsedSpec:
+def load_spec_from_file(
+    file_path: str,
+    cache_dir: Path | None = None,
+    loader: type | None = None,
+) -> ParsedSpec:
     """Load and parse an OpenAPI spec from a file.
     
+    Repeated loads of an unchanged file within one process return the
+    same ParsedSpec object, which callers must treat as read-only.
+    
     Args:
         file_path: Path to YAML or JSON spec file.
+        cache_dir: Optional spec cache directory. When given, the parsed
+            document is reused across runs until the file changes.
+        loader: Optional YAML loader class (see load_document).
         
     Returns:
         Parsed OpenAPI specification.
     """
-    with open(file_path, encoding="utf-8") as f:
+    path = os.path.realpath(file_path)
+    stat = os.stat(path)
+    return _load_spec(path, stat.st_mtime_ns, stat.st_size, cache_dir, loader)
+
+
+# Keyed on the file's modification time and size as well as its path, so
+# an edited file is parsed again
+@lru_cache(maxsize=16)
+def _load_spec(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    cache_dir: Path | None,
+    loader: type | None,
+) -> ParsedSpec:
+    """Load and parse a spec file (memoized by load_spec_from_file)."""
+    if cache_dir is not None:
+        raw_spec = load_cached_spec(path, cache_dir)
+        if raw_spec is not None:
+            return parse_spec(raw_spec)
+    
+    with open(path, encoding="utf-8") as f:
         content = f.read()
-    return parse_spec(content)
+    
+    if cache_dir is None:
+        return parse_spec(content, loader)
+    
+    raw_spec = load_document(content, loader)
+    if isinstance(raw_spec, dict):
+        raw_spec = store_cached_spec(path, cache_dir, raw_spec)
+    return parse_spec(raw_spec)
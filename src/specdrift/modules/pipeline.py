@@ -3,30 +3,48 @@
 Coordinates the full spec drift analysis pipeline.
 """
 
+import asyncio
 import logging
+from pathlib import Path
 from typing import Any
 
+import httpx
+
 from specdrift.types import (
+    AnalysisTarget,
     DriftReport,
     HttpMethod,
+    ParsedEndpoint,
     ParsedSpec,
     RecordedResponse,
 )
 
-from .diff_engine import compare_response_to_schema, summarize_anomalies
+from .diff_engine import DEFAULT_MAX_ANOMALIES, CompiledSchema, summarize_anomalies
 from .decision_engine import (
     classify_decision,
     create_no_drift_report,
     should_invoke_llm,
 )
-from .openapi_parser import get_endpoint_schema, load_spec_from_file, parse_spec, find_matching_endpoint
-from .request_executor import build_request_config, execute_request
+from .openapi_parser import (
+    find_matching_endpoint,
+    load_spec_from_file,
+    parse_spec,
+    resolve_refs,
+)
+from .request_executor import build_request_config, create_http_client, execute_request
 from .semantic_reconciler import reconcile_with_llm
+from .semantic_reconciler.prompt_builder import serialize_fragment
 
 
 # Set up logging
 logger = logging.getLogger("specdrift.pipeline")
 
+# Responses whose decoded body is at least this many bytes are diffed in
+# a worker thread. The diff holds the GIL either way, but the event loop
+# keeps getting turns, so the other requests of a concurrent batch carry
+# on instead of stalling behind one long validation.
+THREADED_DIFF_THRESHOLD = 1024 * 1024
+
 
 async def analyze_endpoint(
     spec_path: str,
@@ -36,6 +54,11 @@ async def analyze_endpoint(
     expected_status: int = 200,
     headers: dict[str, str] | None = None,
     auth_token: str | None = None,
+    spec_cache_dir: Path | None = None,
+    parsed_spec: ParsedSpec | None = None,
+    client: httpx.AsyncClient | None = None,
+    max_anomalies: int | None = DEFAULT_MAX_ANOMALIES,
+    llm_cache_dir: Path | None = None,
 ) -> DriftReport:
     """Analyze a single endpoint for spec drift.
     
@@ -49,6 +72,12 @@ async def analyze_endpoint(
         expected_status: Expected status code.
         headers: Optional request headers.
         auth_token: Optional auth token.
+        spec_cache_dir: Optional directory for caching the parsed spec.
+        parsed_spec: Already-parsed spec; skips loading spec_path again.
+        client: Shared HTTP client for connection reuse.
+        max_anomalies: Cap on anomalies collected (None for no limit).
+        llm_cache_dir: Optional directory for reusing LLM decisions made
+            for identical prompts.
         
     Returns:
         DriftReport with analysis results.
@@ -59,33 +88,37 @@ async def analyze_endpoint(
     
     # Step 1: Load and parse the spec
     logger.info("📄 Step 1: Loading OpenAPI specification...")
-    logger.info(f"   Spec file: {spec_path}")
-    parsed_spec = load_spec_from_file(spec_path)
-    logger.info(f"   ✓ Loaded spec: {parsed_spec.title} v{parsed_spec.version}")
-    logger.info(f"   ✓ Found {len(parsed_spec.endpoints)} endpoints")
+    logger.info("   Spec file: %s", spec_path)
+    if parsed_spec is None:
+        parsed_spec = load_spec_from_file(spec_path, cache_dir=spec_cache_dir)
+    logger.info("   ✓ Loaded spec: %s v%s", parsed_spec.title, parsed_spec.version)
+    logger.info("   ✓ Found %d endpoints", len(parsed_spec.endpoints))
     
     # Step 2: Get the schema for this endpoint
     logger.info("🔎 Step 2: Finding endpoint schema...")
-    logger.info(f"   Looking for: {method.value} {path}")
-    schema = get_endpoint_schema(parsed_spec, path, method, expected_status)
+    logger.info("   Looking for: %s %s", method.value, path)
+    endpoint = find_matching_endpoint(parsed_spec, path, method)
+    schema = endpoint.response_schemas.get(expected_status) if endpoint else None
     if schema is None:
-        logger.error(f"   ✗ No schema found for {method.value} {path} with status {expected_status}")
+        logger.error(
+            "   ✗ No schema found for %s %s with status %s", method.value, path, expected_status
+        )
         raise ValueError(f"No schema found for {method.value} {path} with status {expected_status}")
-    logger.info(f"   ✓ Found schema for status {expected_status}")
+    logger.info("   ✓ Found schema for status %s", expected_status)
     
     # Step 3: Build and execute the request
     logger.info("🌐 Step 3: Executing API request...")
     full_url = endpoint_url.rstrip("/") + path
-    logger.info(f"   URL: {full_url}")
+    logger.info("   URL: %s", full_url)
     config = build_request_config(
         method=method,
         url=full_url,
         headers=headers,
         auth_token=auth_token,
     )
-    response = await execute_request(config)
-    logger.info(f"   ✓ Received response: {response.status_code}")
-    logger.info(f"   ✓ Response time: {response.response_time_ms:.0f}ms")
+    response = await execute_request(config, client=client)
+    logger.info("   ✓ Received response: %s", response.status_code)
+    logger.info("   ✓ Response time: %.0fms", response.response_time_ms)
     
     # Step 4: Run the analysis
     logger.info("🔬 Step 4: Running analysis...")
@@ -97,9 +130,177 @@ async def analyze_endpoint(
         path=path,
         method=method,
         expected_status=expected_status,
+        max_anomalies=max_anomalies,
+        llm_cache_dir=llm_cache_dir,
+        endpoint=endpoint,
     )
 
 
+async def analyze_endpoints(
+    spec_path: str,
+    endpoint_url: str,
+    targets: list[AnalysisTarget],
+    concurrency: int = 20,
+    headers: dict[str, str] | None = None,
+    auth_token: str | None = None,
+    spec_cache_dir: Path | None = None,
+    client: httpx.AsyncClient | None = None,
+    max_anomalies: int | None = DEFAULT_MAX_ANOMALIES,
+    llm_cache_dir: Path | None = None,
+) -> list[DriftReport | Exception]:
+    """Analyze several endpoints concurrently.
+    
+    The spec is parsed once and one HTTP client serves every request; at
+    most ``concurrency`` analyses run at the same time.
+    
+    Args:
+        spec_path: Path to the OpenAPI spec file.
+        endpoint_url: Base URL of the API.
+        targets: Endpoints to analyze.
+        concurrency: Maximum number of analyses in flight.
+        headers: Optional request headers.
+        auth_token: Optional auth token.
+        spec_cache_dir: Optional directory for caching the parsed spec.
+        client: Shared HTTP client. A pooled client is created (and
+            closed) for the batch when omitted.
+        max_anomalies: Cap on anomalies collected per endpoint.
+        llm_cache_dir: Optional directory for reusing LLM decisions made
+            for identical prompts.
+        
+    Returns:
+        One entry per target, in order: its DriftReport, or the exception
+        that aborted its analysis.
+    """
+    if client is None:
+        async with create_http_client() as own_client:
+            return await analyze_endpoints(
+                spec_path=spec_path,
+                endpoint_url=endpoint_url,
+                targets=targets,
+                concurrency=concurrency,
+                headers=headers,
+                auth_token=auth_token,
+                spec_cache_dir=spec_cache_dir,
+                client=own_client,
+                max_anomalies=max_anomalies,
+                llm_cache_dir=llm_cache_dir,
+            )
+    
+    parsed_spec = load_spec_from_file(spec_path, cache_dir=spec_cache_dir)
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def run(target: AnalysisTarget) -> DriftReport | Exception:
+        async with semaphore:
+            try:
+                return await analyze_endpoint(
+                    spec_path=spec_path,
+                    endpoint_url=endpoint_url,
+                    path=target.path,
+                    method=target.method,
+                    expected_status=target.expected_status,
+                    headers=headers,
+                    auth_token=auth_token,
+                    parsed_spec=parsed_spec,
+                    client=client,
+                    max_anomalies=max_anomalies,
+                    llm_cache_dir=llm_cache_dir,
+                )
+            except Exception as e:
+                logger.error("   ✗ %s %s: %s", target.method.value, target.path, e)
+                return e
+    
+    return await asyncio.gather(*(run(target) for target in targets))
+
+
+async def analyze_spec(
+    spec_path: str,
+    endpoint_url: str,
+    concurrency: int = 20,
+    headers: dict[str, str] | None = None,
+    auth_token: str | None = None,
+    spec_cache_dir: Path | None = None,
+    client: httpx.AsyncClient | None = None,
+    max_anomalies: int | None = DEFAULT_MAX_ANOMALIES,
+    llm_cache_dir: Path | None = None,
+) -> list[DriftReport | Exception]:
+    """Analyze every endpoint of a spec that can be called without inputs.
+    
+    See spec_targets() for which endpoints are included; they are
+    analyzed concurrently with analyze_endpoints().
+    
+    Args:
+        spec_path: Path to the OpenAPI spec file.
+        endpoint_url: Base URL of the API.
+        concurrency: Maximum number of analyses in flight.
+        headers: Optional request headers.
+        auth_token: Optional auth token.
+        spec_cache_dir: Optional directory for caching the parsed spec.
+        client: Shared HTTP client, created for the run when omitted.
+        max_anomalies: Cap on anomalies collected per endpoint.
+        llm_cache_dir: Optional directory for reusing LLM decisions made
+            for identical prompts.
+        
+    Returns:
+        One entry per target from spec_targets(), in order: its
+        DriftReport, or the exception that aborted its analysis.
+    """
+    parsed_spec = load_spec_from_file(spec_path, cache_dir=spec_cache_dir)
+    return await analyze_endpoints(
+        spec_path=spec_path,
+        endpoint_url=endpoint_url,
+        targets=spec_targets(parsed_spec),
+        concurrency=concurrency,
+        headers=headers,
+        auth_token=auth_token,
+        spec_cache_dir=spec_cache_dir,
+        client=client,
+        max_anomalies=max_anomalies,
+        llm_cache_dir=llm_cache_dir,
+    )
+
+
+def spec_targets(parsed_spec: ParsedSpec) -> list[AnalysisTarget]:
+    """List the endpoints of a spec that can be called without inputs.
+    
+    These are GET endpoints with no path parameters and no required
+    parameters of their own or of their path item, each expected to
+    return its lowest documented 2xx status that has a response schema.
+    """
+    targets = []
+    ref_cache: dict[str, dict[str, Any]] = {}
+    for endpoint in parsed_spec.endpoints:
+        if endpoint.method != HttpMethod.GET or None in endpoint.path_segments:
+            continue
+        if _needs_parameters(parsed_spec, endpoint, ref_cache):
+            continue
+        success_codes = [code for code in endpoint.response_schemas if 200 <= code < 300]
+        if success_codes:
+            targets.append(AnalysisTarget(path=endpoint.path, expected_status=min(success_codes)))
+    return targets
+
+
+def _needs_parameters(
+    parsed_spec: ParsedSpec,
+    endpoint: ParsedEndpoint,
+    ref_cache: dict[str, dict[str, Any]],
+) -> bool:
+    """Whether calling an endpoint requires some parameter value.
+    
+    Path item parameters apply unless the operation redefines them (same
+    name and location). $ref'd parameters are resolved first; one that
+    cannot be resolved counts as required.
+    """
+    path_item = parsed_spec.raw_spec.get("paths", {}).get(endpoint.path, {})
+    effective: dict[tuple[Any, Any], dict[str, Any]] = {}
+    for param in [*path_item.get("parameters", ()), *endpoint.parameters]:
+        try:
+            param = resolve_refs(param, parsed_spec.raw_spec, ref_cache)
+        except ValueError:
+            return True
+        effective[(param.get("name"), param.get("in"))] = param
+    return any(param.get("required") for param in effective.values())
+
+
 async def analyze_response(
     spec_path: str,
     parsed_spec: ParsedSpec,
@@ -108,6 +309,9 @@ async def analyze_response(
     path: str,
     method: HttpMethod,
     expected_status: int,
+    max_anomalies: int | None = DEFAULT_MAX_ANOMALIES,
+    llm_cache_dir: Path | None = None,
+    endpoint: ParsedEndpoint | None = None,
 ) -> DriftReport:
     """Analyze a recorded response against a schema.
     
@@ -119,6 +323,11 @@ async def analyze_response(
         path: API path.
         method: HTTP method.
         expected_status: Expected status code.
+        max_anomalies: Cap on anomalies collected (None for no limit).
+        llm_cache_dir: Optional directory for reusing LLM decisions made
+            for identical prompts.
+        endpoint: The spec endpoint matching path and method, when the
+            caller already looked it up.
         
     Returns:
         DriftReport with analysis results.
@@ -126,26 +335,28 @@ async def analyze_response(
     endpoint_context = f"{method.value} {path}"
     
     # Get expected status codes from the endpoint
-    matching_endpoint = find_matching_endpoint(parsed_spec, path, method)
-    expected_status_codes = []
-    if matching_endpoint:
-        expected_status_codes = list(matching_endpoint.response_schemas.keys())
+    matching_endpoint = endpoint or find_matching_endpoint(parsed_spec, path, method)
+    expected_status_codes = _endpoint_status_codes(matching_endpoint)
     
     # Step 4: Deterministic diff (NO LLM)
     logger.info("🔍 Step 4a: Running deterministic diff engine...")
     logger.info("   (NO LLM used in this step)")
-    anomalies = compare_response_to_schema(
-        response_body=response.body,
-        response_status=response.status_code,
-        schema=schema,
-        expected_status_codes=expected_status_codes,
-    )
-    logger.info(f"   ✓ Detected {len(anomalies)} anomalies")
+    compiled = CompiledSchema(schema, expected_status_codes, max_anomalies)
+    if _body_size(response) >= THREADED_DIFF_THRESHOLD:
+        anomalies = await asyncio.to_thread(
+            compiled.validate, response.body, response.status_code
+        )
+    else:
+        anomalies = compiled.validate(response.body, response.status_code)
+    logger.info("   ✓ Detected %d anomalies", len(anomalies))
+    if max_anomalies is not None and len(anomalies) >= max_anomalies:
+        logger.warning("   ! Stopped at the limit of %d anomalies", max_anomalies)
     
-    # Log anomaly details
-    for i, anomaly in enumerate(anomalies, 1):
-        logger.info(f"   [{i}] {anomaly.anomaly_type.value}: {anomaly.json_path}")
-        logger.debug(f"       Expected: {anomaly.expected}, Actual: {anomaly.actual}")
+    # Log anomaly details, skipping the loop entirely when INFO is off
+    if logger.isEnabledFor(logging.INFO):
+        for i, anomaly in enumerate(anomalies, 1):
+            logger.info("   [%d] %s: %s", i, anomaly.anomaly_type.value, anomaly.json_path)
+            logger.debug("       Expected: %s, Actual: %s", anomaly.expected, anomaly.actual)
     
     # Step 5: Check if LLM is needed
     logger.info("🤔 Step 5: Checking if LLM reconciliation needed...")
@@ -156,17 +367,17 @@ async def analyze_response(
             spec_path=spec_path,
         )
     
-    logger.info(f"   → {len(anomalies)} anomalies found - invoking LLM")
+    logger.info("   → %d anomalies found - invoking LLM", len(anomalies))
     
     # Step 6: Summarize anomalies for LLM
     logger.info("📋 Step 6: Summarizing anomalies for LLM...")
     anomaly_summary = summarize_anomalies(anomalies, response.body)
-    logger.info(f"   ✓ Anomaly types: {list(anomaly_summary.anomalies_by_type.keys())}")
+    logger.info("   ✓ Anomaly types: %s", list(anomaly_summary.anomalies_by_type.keys()))
     
     # Step 7: Get the OpenAPI fragment for this endpoint
     logger.info("📑 Step 7: Extracting OpenAPI fragment...")
-    openapi_fragment = _extract_endpoint_fragment(parsed_spec, path, method)
-    logger.info(f"   ✓ Fragment extracted")
+    openapi_fragment = _endpoint_fragment_json(matching_endpoint)
+    logger.info("   ✓ Fragment extracted")
     
     # Step 8: LLM semantic reconciliation
     logger.info("🤖 Step 8: Invoking LLM for semantic reconciliation...")
@@ -174,9 +385,10 @@ async def analyze_response(
         openapi_fragment=openapi_fragment,
         anomaly_summary=anomaly_summary,
         endpoint_context=endpoint_context,
+        cache_dir=llm_cache_dir,
     )
-    logger.info(f"   ✓ LLM decision: {llm_decision.decision.value}")
-    logger.info(f"   ✓ Confidence: {llm_decision.confidence:.0%}")
+    logger.info("   ✓ LLM decision: %s", llm_decision.decision.value)
+    logger.info("   ✓ Confidence: %.0f%%", llm_decision.confidence * 100)
     
     # Step 9: Classify and build report
     logger.info("📊 Step 9: Building final report...")
@@ -186,38 +398,60 @@ async def analyze_response(
         spec_path=spec_path,
         anomaly_summary=anomaly_summary,
     )
-    logger.info(f"   ✓ Report generated: has_drift={report.has_drift}")
+    logger.info("   ✓ Report generated: has_drift=%s", report.has_drift)
     logger.info("=" * 60)
     
     return report
 
 
-def _extract_endpoint_fragment(
-    parsed_spec: ParsedSpec,
-    path: str,
-    method: HttpMethod,
-) -> dict[str, Any]:
+def _endpoint_fragment_json(endpoint: ParsedEndpoint | None) -> str:
+    """Get the serialized OpenAPI fragment for an endpoint.
+    
+    Serialized once per endpoint and kept on it, so repeated analyses of
+    the same endpoint in a batch skip re-encoding the operation.
+    """
+    if endpoint is None:
+        return serialize_fragment({})
+    if endpoint._fragment_json is None:
+        endpoint._fragment_json = serialize_fragment(_extract_endpoint_fragment(endpoint))
+    return endpoint._fragment_json
+
+
+def _body_size(response: RecordedResponse) -> int:
+    """Get the size of a response's decoded body.
+    
+    Chunked and compressed bodies have no usable Content-Length, so the
+    size recorded by the request executor is preferred. Responses recorded
+    elsewhere fall back to Content-Length, or 0 when it is missing or
+    invalid.
+    """
+    if response.body_size is not None:
+        return response.body_size
+    try:
+        return int(response.headers.get("content-length", 0))
+    except ValueError:
+        return 0
+
+
+def _endpoint_status_codes(endpoint: ParsedEndpoint | None) -> frozenset[int]:
+    """Get the documented status codes of an endpoint, built once per endpoint."""
+    if endpoint is None:
+        return frozenset()
+    if endpoint._status_codes is None:
+        endpoint._status_codes = frozenset(endpoint.response_schemas)
+    return endpoint._status_codes
+
+
+def _extract_endpoint_fragment(endpoint: ParsedEndpoint | None) -> dict[str, Any]:
     """Extract the OpenAPI fragment for an endpoint."""
-    # Find the matching endpoint (handles path params)
-    matching_endpoint = find_matching_endpoint(parsed_spec, path, method)
-    if not matching_endpoint:
+    if endpoint is None or not endpoint.raw_operation:
         return {}
     
-    # Use the spec path (with {param} placeholders) to get the fragment
-    spec_path = matching_endpoint.path
-    raw_spec = parsed_spec.raw_spec
-    paths = raw_spec.get("paths", {})
-    
-    if spec_path in paths:
-        path_item = paths[spec_path]
-        method_lower = method.value.lower()
-        if method_lower in path_item:
-            return {
-                "paths": {
-                    spec_path: {
-                        method_lower: path_item[method_lower]
-                    }
-                }
+    # Keyed by the spec path (with {param} placeholders)
+    return {
+        "paths": {
+            endpoint.path: {
+                endpoint.method.value.lower(): endpoint.raw_operation
             }
-    
-    return {}
+        }
+    }
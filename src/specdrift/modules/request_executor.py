@@ -4,23 +4,97 @@ Executes HTTP requests against API endpoints and records responses.
 No retry logic - explicit per requirements.
 """
 
+import importlib
+import importlib.util
+import re
 import time
 from typing import Any
 
 import httpx
 
-from specdrift.types import HttpMethod, RecordedResponse, RequestConfig
+from specdrift import jsonutil
+from specdrift.types import HttpMethod, HttpTransport, RecordedResponse, RequestConfig
+
+# Connection pool sizing for shared clients
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 50
+
+# JSON bodies at least this large (by Content-Length) are streamed into a
+# preallocated buffer rather than collected as chunks and joined
+STREAM_BUFFER_THRESHOLD = 1024 * 1024
+
+# A {param} placeholder in a URL template
+_PATH_PARAM = re.compile(r"\{([^{}]+)\}")
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def create_http_client(
+    timeout: float = 30.0,
+    transport: HttpTransport = HttpTransport.HTTPX,
+) -> httpx.AsyncClient:
+    """Create a pooled HTTP client to share across requests.
+    
+    Reusing one client keeps connections alive between requests, avoiding
+    a TCP/TLS handshake per call. The caller owns the client and must
+    close it (e.g. ``async with create_http_client() as client``).
+    
+    Args:
+        timeout: Default request timeout in seconds.
+        transport: HTTPX uses httpx's own connection pool. AIOHTTP routes
+            requests through a single aiohttp session (via the optional
+            httpx-aiohttp package), which holds up better at high
+            concurrency.
+        
+    Returns:
+        Configured httpx.AsyncClient.
+        
+    Raises:
+        ValueError: If the aiohttp transport is requested but not installed.
+    """
+    if transport == HttpTransport.AIOHTTP:
+        try:
+            httpx_aiohttp = importlib.import_module("httpx_aiohttp")
+        except ImportError as e:
+            raise ValueError(
+                "The aiohttp transport requires the httpx-aiohttp package "
+                "(install the 'aiohttp' extra)"
+            ) from e
+        aiohttp_client: httpx.AsyncClient = httpx_aiohttp.HttpxAiohttpClient(
+            timeout=timeout,
+            limits=_pool_limits(),
+        )
+        return aiohttp_client
+    
+    return httpx.AsyncClient(
+        timeout=timeout,
+        limits=_pool_limits(),
+        http2=HTTP2_AVAILABLE,
+    )
+
+
+def _pool_limits() -> httpx.Limits:
+    """Connection pool limits shared by every client flavour."""
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+    )
 
 
 async def execute_request(
     config: RequestConfig,
     timeout: float = 30.0,
+    client: httpx.AsyncClient | None = None,
 ) -> RecordedResponse:
     """Execute an HTTP request and record the response.
     
     Args:
         config: Request configuration including URL, method, headers, etc.
         timeout: Request timeout in seconds.
+        client: Client to send the request with, e.g. one from
+            create_http_client() shared across requests. Without one, a
+            client is opened and closed for this request alone.
         
     Returns:
         RecordedResponse with status, headers, body, and timing.
@@ -29,9 +103,7 @@ async def execute_request(
         httpx.HTTPError: If the request fails at the network level.
     """
     # Build the full URL with path params
-    url = config.url
-    for param_name, param_value in config.path_params.items():
-        url = url.replace(f"{{{param_name}}}", param_value)
+    url = _substitute_path_params(config.url, config.path_params)
     
     # Build headers
     headers = dict(config.headers)
@@ -41,14 +113,11 @@ async def execute_request(
     # Execute request with timing
     start_time = time.perf_counter()
     
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.request(
-            method=config.method.value,
-            url=url,
-            params=config.query_params or None,
-            headers=headers or None,
-            json=config.body if config.body is not None else None,
-        )
+    if client is not None:
+        response, content = await _send(client, config, url, headers, timeout)
+    else:
+        async with create_http_client(timeout=timeout) as own_client:
+            response, content = await _send(own_client, config, url, headers, timeout)
     
     elapsed_ms = (time.perf_counter() - start_time) * 1000
     
@@ -57,11 +126,11 @@ async def execute_request(
     content_type = response.headers.get("content-type", "")
     if "application/json" in content_type:
         try:
-            body = response.json()
+            body = jsonutil.loads(content)
         except Exception:
-            body = response.text
+            body = _decode_text(response, content)
     else:
-        body = response.text
+        body = _decode_text(response, content)
     
     # Convert headers to dict
     response_headers = dict(response.headers)
@@ -72,9 +141,93 @@ async def execute_request(
         body=body,
         response_time_ms=elapsed_ms,
         request_config=config,
+        body_size=len(content),
     )
 
 
+async def _send(
+    client: httpx.AsyncClient,
+    config: RequestConfig,
+    url: str,
+    headers: dict[str, str],
+    timeout: float,
+) -> tuple[httpx.Response, bytes | bytearray]:
+    """Send a request described by config on the given client.
+    
+    Returns:
+        The response and its complete body.
+    """
+    request = client.build_request(
+        method=config.method.value,
+        url=url,
+        params=config.query_params or None,
+        headers=headers or None,
+        json=config.body if config.body is not None else None,
+        timeout=timeout,
+    )
+    response = await client.send(request, stream=True)
+    try:
+        size = _streamable_size(response)
+        if size is not None:
+            content: bytes | bytearray = await _read_into_buffer(response, size)
+        else:
+            content = await response.aread()
+    finally:
+        await response.aclose()
+    return response, content
+
+
+def _streamable_size(response: httpx.Response) -> int | None:
+    """Get the declared size of a large, uncompressed JSON body.
+    
+    Returns:
+        The Content-Length when the body should be read into a
+        preallocated buffer, None otherwise.
+    """
+    if "application/json" not in response.headers.get("content-type", ""):
+        return None
+    if response.headers.get("content-encoding", "identity") != "identity":
+        # Content-Length counts compressed bytes
+        return None
+    try:
+        size = int(response.headers.get("content-length", ""))
+    except ValueError:
+        return None
+    return size if size >= STREAM_BUFFER_THRESHOLD else None
+
+
+async def _read_into_buffer(response: httpx.Response, size: int) -> bytearray:
+    """Stream a body into a buffer preallocated from its declared size.
+    
+    The chunks are copied in place as they arrive, so the body is held in
+    memory once instead of as a chunk list plus the joined result.
+    """
+    buffer = bytearray(size)
+    filled = 0
+    async for chunk in response.aiter_bytes():
+        end = filled + len(chunk)
+        # Grows the buffer if the server sends more than it declared
+        buffer[filled:end] = chunk
+        filled = end
+    del buffer[filled:]
+    return buffer
+
+
+def _substitute_path_params(url: str, path_params: dict[str, str]) -> str:
+    """Fill {param} placeholders in a URL in a single pass.
+    
+    Placeholders without a value are left as they are.
+    """
+    if not path_params:
+        return url
+    return _PATH_PARAM.sub(lambda match: path_params.get(match[1], match[0]), url)
+
+
+def _decode_text(response: httpx.Response, content: bytes | bytearray) -> str:
+    """Decode a body as text, like httpx.Response.text."""
+    return content.decode(response.encoding or "utf-8", errors="replace")
+
+
 def build_request_config(
     method: str | HttpMethod,
     url: str,
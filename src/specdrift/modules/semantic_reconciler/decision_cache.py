@@ -0,0 +1,76 @@
+"""Decision Cache - Reuse LLM decisions for identical prompts.
+
+Re-running an analysis against unchanged drift (CI re-runs, flapping
+tests) produces the same prompt. The LLM decision for a prompt is stored
+under the cache directory, keyed by a hash of the model, system prompt
+and user prompt, so identical requests skip the LLM entirely.
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from specdrift.types import LLMDecision
+
+# Set up logging
+logger = logging.getLogger("specdrift.decision_cache")
+
+
+def decision_key(model: str, system_prompt: str, user_prompt: str) -> str:
+    """Build the cache key for an LLM request."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (model, system_prompt, user_prompt):
+        encoded = part.encode()
+        # Length-prefix each part so boundaries cannot shift
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+def load_cached_decision(key: str, cache_dir: Path) -> LLMDecision | None:
+    """Load a previously cached decision.
+
+    Args:
+        key: Key from decision_key().
+        cache_dir: Cache directory.
+
+    Returns:
+        The cached decision, or None on a cache miss.
+    """
+    cache_file = _cache_file(key, cache_dir)
+    try:
+        data = cache_file.read_bytes()
+    except OSError:
+        return None
+
+    try:
+        return LLMDecision.model_validate_json(data)
+    except ValidationError:
+        logger.debug("Ignoring corrupt decision cache entry %s", cache_file)
+        return None
+
+
+def store_cached_decision(key: str, cache_dir: Path, decision: LLMDecision) -> None:
+    """Store a decision in the cache.
+
+    Args:
+        key: Key from decision_key().
+        cache_dir: Cache directory.
+        decision: The LLM decision to store.
+    """
+    cache_file = _cache_file(key, cache_dir)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(decision.model_dump_json(), encoding="utf-8")
+        tmp_file.replace(cache_file)
+    except OSError as e:
+        logger.debug("Could not write decision cache %s: %s", cache_file, e)
+
+
+def _cache_file(key: str, cache_dir: Path) -> Path:
+    """Get the cache file location for a decision."""
+    return cache_dir / "llm" / f"{key}.json"
@@ -3,16 +3,20 @@
 Uses the google-genai SDK with structured output.
 """
 
-import json
+import asyncio
 import logging
 import os
+import weakref
+from pathlib import Path
 from typing import Any
 
 from google import genai
 from google.genai import types
 
+from specdrift import jsonutil
 from specdrift.types import AnomalySummary, LLMDecision, DecisionType, ChangeType, ChangeInstruction
 
+from .decision_cache import decision_key, load_cached_decision, store_cached_decision
 from .prompt_builder import build_reconciliation_prompt, get_system_prompt
 
 
@@ -63,23 +67,64 @@ LLM_OUTPUT_SCHEMA = {
 }
 
 
+# Generation settings are identical for every call, so the config (and
+# the schema inside it) is built once
+GENERATION_CONFIG = types.GenerateContentConfig(
+    system_instruction=get_system_prompt(),
+    response_mime_type="application/json",
+    response_schema=LLM_OUTPUT_SCHEMA,
+    temperature=0.1,  # Low temperature for consistency
+)
+
+
+# One client per API key, with a weak reference to the event loop it was
+# created on
+_clients: dict[str, tuple[genai.Client, weakref.ref[asyncio.AbstractEventLoop]]] = {}
+
+
+def _get_client(api_key: str) -> genai.Client:
+    """Get the client for an API key, creating it on first use.
+    
+    The client's async HTTP session cannot be reused once the loop that
+    opened it has closed, so a client created on another loop (e.g. an
+    earlier ``asyncio.run``) is replaced. The replaced client's sync
+    session is closed; its async one can only be released with its loop.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(api_key)
+    if entry is not None:
+        client, client_loop = entry
+        if client_loop() is loop:
+            return client
+        client.close()
+    
+    client = genai.Client(api_key=api_key)
+    _clients[api_key] = (client, weakref.ref(loop))
+    return client
+
+
 async def reconcile_with_llm(
-    openapi_fragment: dict[str, Any],
+    openapi_fragment: dict[str, Any] | str,
     anomaly_summary: AnomalySummary,
     endpoint_context: str,
     model: str = DEFAULT_MODEL,
     api_key: str | None = None,
+    cache_dir: Path | None = None,
 ) -> LLMDecision:
     """Use the LLM to reconcile spec drift.
     
     This is the ONLY place where LLM is invoked in the agent.
     
     Args:
-        openapi_fragment: Relevant portion of the OpenAPI spec.
+        openapi_fragment: Relevant portion of the OpenAPI spec, as a dict
+            or already serialized (see build_reconciliation_prompt).
         anomaly_summary: Summary of detected anomalies.
         endpoint_context: Context about the endpoint (path, method).
         model: Gemini model to use.
         api_key: Optional API key (uses GOOGLE_API_KEY env var if not provided).
+        cache_dir: Optional decision cache directory. When given, a
+            decision is reused for an identical prompt instead of calling
+            the LLM again.
         
     Returns:
         LLMDecision with classification and proposed changes.
@@ -87,6 +132,22 @@ async def reconcile_with_llm(
     Raises:
         ValueError: If the LLM returns invalid output.
     """
+    # Build the prompt
+    user_prompt = build_reconciliation_prompt(
+        openapi_fragment=openapi_fragment,
+        anomaly_summary=anomaly_summary,
+        endpoint_context=endpoint_context,
+    )
+    
+    # An identical prompt was already answered
+    cache_key = None
+    if cache_dir is not None:
+        cache_key = decision_key(model, get_system_prompt(), user_prompt)
+        cached = load_cached_decision(cache_key, cache_dir)
+        if cached is not None:
+            logger.info("   ✓ Reusing cached LLM decision")
+            return cached
+    
     # Get API key
     resolved_api_key = api_key or os.environ.get("GOOGLE_API_KEY")
     if not resolved_api_key:
@@ -96,18 +157,10 @@ async def reconcile_with_llm(
     logger.debug(f"   Model: {model}")
     logger.debug(f"   Endpoint: {endpoint_context}")
     logger.debug(f"   Anomalies: {anomaly_summary.total_anomalies}")
-    
-    # Build the prompt
-    user_prompt = build_reconciliation_prompt(
-        openapi_fragment=openapi_fragment,
-        anomaly_summary=anomaly_summary,
-        endpoint_context=endpoint_context,
-    )
-    
     logger.debug(f"   Prompt length: {len(user_prompt)} chars")
     
-    # Create client
-    client = genai.Client(api_key=resolved_api_key)
+    # Reuse the client (and its authenticated session) across calls
+    client = _get_client(resolved_api_key)
     
     # Make the request with structured output using raw schema
     logger.info("   Sending request to Gemini API...")
@@ -115,12 +168,7 @@ async def reconcile_with_llm(
     response = await client.aio.models.generate_content(
         model=model,
         contents=user_prompt,
-        config=types.GenerateContentConfig(
-            system_instruction=get_system_prompt(),
-            response_mime_type="application/json",
-            response_schema=LLM_OUTPUT_SCHEMA,
-            temperature=0.1,  # Low temperature for consistency
-        ),
+        config=GENERATION_CONFIG,
     )
     
     # Parse and validate the response
@@ -132,15 +180,15 @@ async def reconcile_with_llm(
     
     # Parse the JSON response
     try:
-        data = json.loads(response.text)
+        data = jsonutil.loads(response.text)
         
         # Parse the updated_openapi_fragment from JSON string if present
         fragment_json = data.get("updated_openapi_fragment_json", "")
         updated_fragment = None
         if fragment_json and fragment_json.strip():
             try:
-                updated_fragment = json.loads(fragment_json)
-            except json.JSONDecodeError:
+                updated_fragment = jsonutil.loads(fragment_json)
+            except ValueError:
                 logger.warning("   Could not parse updated_openapi_fragment_json")
         
         # Convert to LLMDecision
@@ -162,11 +210,13 @@ async def reconcile_with_llm(
         
         logger.info(f"   Decision: {decision.decision.value} (confidence: {decision.confidence:.0%})")
         
-        return decision
-        
     except Exception as e:
         logger.error(f"   ✗ Failed to parse LLM response: {e}")
         raise ValueError(f"LLM returned invalid JSON: {e}") from e
+    
+    if cache_key is not None and cache_dir is not None:
+        store_cached_decision(cache_key, cache_dir, decision)
+    return decision
 
 
 def create_llm_client(api_key: str | None = None) -> genai.Client:
@@ -26,14 +26,15 @@ You must respond with valid JSON matching the required schema. No prose outside
 
 
 def build_reconciliation_prompt(
-    openapi_fragment: dict[str, Any],
+    openapi_fragment: dict[str, Any] | str,
     anomaly_summary: AnomalySummary,
     endpoint_context: str,
 ) -> str:
     """Build a prompt for the LLM to analyze spec drift.
     
     Args:
-        openapi_fragment: Relevant portion of the OpenAPI spec.
+        openapi_fragment: Relevant portion of the OpenAPI spec, or the
+            output of serialize_fragment() for it.
         anomaly_summary: Summary of detected anomalies.
         endpoint_context: Context about the endpoint (path, method).
         
@@ -43,12 +44,15 @@ def build_reconciliation_prompt(
     # Format anomalies for readability
     anomalies_text = format_anomalies(anomaly_summary)
     
+    if not isinstance(openapi_fragment, str):
+        openapi_fragment = serialize_fragment(openapi_fragment)
+    
     prompt = f"""## Endpoint Context
 {endpoint_context}
 
 ## Current OpenAPI Specification Fragment
 ```json
-{json.dumps(openapi_fragment, indent=2)}
+{openapi_fragment}
 ```
 
 ## Observed Response Sample
@@ -71,16 +75,29 @@ Consider backward compatibility and real-world API evolution patterns."""
     return prompt
 
 
+def serialize_fragment(openapi_fragment: dict[str, Any]) -> str:
+    """Serialize an OpenAPI fragment the way prompts embed it.
+    
+    Callers that prompt repeatedly for the same endpoint can serialize its
+    fragment once and pass the string to build_reconciliation_prompt().
+    """
+    return json.dumps(openapi_fragment, indent=2)
+
+
 def format_anomalies(summary: AnomalySummary) -> str:
-    """Format anomalies into a readable list."""
-    lines = []
-    for i, anomaly in enumerate(summary.anomalies, 1):
-        lines.append(f"{i}. [{anomaly.anomaly_type.value}] at {anomaly.json_path}")
-        lines.append(f"   Expected: {anomaly.expected}")
-        lines.append(f"   Actual: {anomaly.actual}")
-        lines.append(f"   {anomaly.message}")
-        lines.append("")
-    return "\n".join(lines)
+    """Format anomalies into a readable list.
+    
+    The text is built once per summary and reused, e.g. across retries.
+    """
+    if summary._anomalies_text is None:
+        summary._anomalies_text = "\n".join(
+            f"{i}. [{anomaly.anomaly_type.value}] at {anomaly.json_path}\n"
+            f"   Expected: {anomaly.expected}\n"
+            f"   Actual: {anomaly.actual}\n"
+            f"   {anomaly.message}\n"
+            for i, anomaly in enumerate(summary.anomalies, 1)
+        )
+    return summary._anomalies_text
 
 
 def get_system_prompt() -> str:
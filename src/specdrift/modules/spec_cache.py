@@ -0,0 +1,96 @@
+"""Spec Cache - Warm-start storage for parsed OpenAPI documents.
+
+YAML parsing dominates single-endpoint runs. The parsed document is stored
+as JSON under the cache directory, keyed by the spec file's path,
+modification time and size, so unchanged specs skip YAML entirely.
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from specdrift import jsonutil
+
+# Set up logging
+logger = logging.getLogger("specdrift.spec_cache")
+
+# Default cache location, honouring XDG_CACHE_HOME
+DEFAULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "specdrift"
+
+
+def cache_key(file_path: str | Path) -> str:
+    """Build the cache key for a spec file from its path, mtime and size."""
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    fingerprint = f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+    return hashlib.sha256(fingerprint.encode()).hexdigest()[:32]
+
+
+def load_cached_spec(file_path: str | Path, cache_dir: Path) -> dict[str, Any] | None:
+    """Load a previously cached spec document.
+
+    Args:
+        file_path: Path to the spec file.
+        cache_dir: Cache directory.
+
+    Returns:
+        The cached document, or None on a cache miss.
+    """
+    cache_file = _cache_file(file_path, cache_dir)
+    try:
+        data = cache_file.read_bytes()
+    except OSError:
+        return None
+
+    try:
+        raw_spec = jsonutil.loads(data)
+    except ValueError:
+        logger.debug("Ignoring corrupt spec cache entry %s", cache_file)
+        return None
+    return raw_spec if isinstance(raw_spec, dict) else None
+
+
+def store_cached_spec(
+    file_path: str | Path,
+    cache_dir: Path,
+    raw_spec: dict[str, Any],
+) -> dict[str, Any]:
+    """Store a parsed spec document in the cache.
+
+    The document is normalized through JSON (e.g. integer status code keys
+    become strings) and the normalized form is returned, so cold and warm
+    runs see identical data.
+
+    Args:
+        file_path: Path to the spec file.
+        cache_dir: Cache directory.
+        raw_spec: The freshly parsed spec document.
+
+    Returns:
+        The JSON-normalized document, or raw_spec if it cannot be cached.
+    """
+    try:
+        data = jsonutil.dumps(raw_spec)
+    except (TypeError, ValueError):
+        # Not JSON-representable (e.g. YAML timestamps without orjson)
+        logger.debug("Spec %s is not JSON-serializable; not caching", file_path)
+        return raw_spec
+
+    cache_file = _cache_file(file_path, cache_dir)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_bytes(data)
+        tmp_file.replace(cache_file)
+    except OSError as e:
+        logger.debug("Could not write spec cache %s: %s", cache_file, e)
+
+    normalized: dict[str, Any] = jsonutil.loads(data)
+    return normalized
+
+
+def _cache_file(file_path: str | Path, cache_dir: Path) -> Path:
+    """Get the cache file location for a spec file."""
+    return cache_dir / "specs" / f"{cache_key(file_path)}.json"
@@ -4,16 +4,51 @@ Generates minimal, git-diff friendly spec updates.
 """
 
 import copy
-from typing import Any
+import difflib
+import hashlib
+import re
+from functools import lru_cache
+from typing import IO, Any
 
 import yaml
 from jsonpath_ng import parse as parse_jsonpath  # type: ignore[import-untyped]
 
+from specdrift import jsonutil
+
+# Prefer the libyaml-backed dumper, which emits large specs several times faster
+try:
+    from yaml import CSafeDumper as SpecDumper
+except ImportError:  # libyaml not available
+    from yaml import SafeDumper as SpecDumper  # type: ignore[assignment]
+
+# Characters and tokens that only occur in real JSONPath expressions
+# (filters, wildcards, subscripts, recursive descent)
+_JSONPATH_SYNTAX = re.compile(r"[\[\]*?@()|&]|\.\.")
+
+# Path segments jsonpath-ng needs quoted: URL paths and numeric keys
+_QUOTED_SEGMENT = re.compile(r"/|\d+$")
+
+# Maximum number of rendered top-level sections generate_diff_output keeps
+SECTION_CACHE_SIZE = 64
+
+# Emitter options keeping the spec's key order and block style
+_YAML_STYLE: dict[str, Any] = {
+    "default_flow_style": False,
+    "sort_keys": False,
+    "allow_unicode": True,
+}
+
+# Scalar classes that can be shared between copies
+_IMMUTABLE_SCALARS = frozenset((str, int, float, bool, type(None)))
+
 
 def apply_updates(
     original_spec: dict[str, Any],
     updated_fragment: dict[str, Any],
     json_path: str | None = None,
+    *,
+    copy_spec: bool = True,
+    json_clone: bool = False,
 ) -> dict[str, Any]:
     """Apply updates to an OpenAPI specification.
     
@@ -21,77 +56,209 @@ def apply_updates(
         original_spec: The original OpenAPI spec.
         updated_fragment: The updated fragment to apply.
         json_path: Optional JSON path to apply the fragment at.
+        copy_spec: Apply the updates to a copy, leaving original_spec
+            untouched. Callers that no longer need the original (e.g.
+            before saving the result) can pass False to update it in place.
+        json_clone: Copy the spec through orjson when it is installed,
+            which is faster for large specs. Only for specs holding plain
+            JSON data (e.g. as stored by the spec cache): NaN and infinite
+            floats would become null. Specs with non-string keys fall back
+            to the regular copy.
+        
+    Returns:
+        Updated specification.
+    """
+    return apply_updates_batch(
+        original_spec,
+        [(json_path, updated_fragment)],
+        copy_spec=copy_spec,
+        json_clone=json_clone,
+    )
+
+
+def apply_updates_batch(
+    original_spec: dict[str, Any],
+    updates: list[tuple[str | None, dict[str, Any]]],
+    *,
+    copy_spec: bool = True,
+    json_clone: bool = False,
+) -> dict[str, Any]:
+    """Apply several updates to an OpenAPI specification at once.
+    
+    Same as calling apply_updates() for each update in turn, but the
+    spec is copied only once.
+    
+    Args:
+        original_spec: The original OpenAPI spec.
+        updates: (json_path, fragment) pairs, applied in order. A None
+            path merges the fragment into the spec.
+        copy_spec: See apply_updates().
+        json_clone: See apply_updates().
         
     Returns:
         Updated specification.
     """
     # Deep copy to avoid mutating the original
-    updated_spec = copy.deepcopy(original_spec)
+    updated_spec: dict[str, Any] = (
+        _clone_spec(original_spec, json_clone) if copy_spec else original_spec
+    )
     
-    if json_path:
-        # Apply fragment at specific path
-        _apply_at_path(updated_spec, json_path, updated_fragment)
-    else:
-        # Merge the fragment into the spec
-        _deep_merge(updated_spec, updated_fragment)
+    # Until the first update lands, the copy still matches original_spec,
+    # so fragment values that are original_spec's own objects are already
+    # in place
+    source = original_spec
+    for json_path, fragment in updates:
+        if json_path:
+            # Apply fragment at specific path
+            _apply_at_path(updated_spec, json_path, fragment)
+        elif fragment and fragment is not source:
+            # Merge the fragment into the spec; merging nothing, or the
+            # spec into itself, changes nothing
+            _deep_merge(updated_spec, fragment, source)
+        source = updated_spec
     
     return updated_spec
 
 
 def _apply_at_path(spec: dict[str, Any], path: str, value: Any) -> None:
     """Apply a value at a specific JSON path."""
+    parts = _split_path(path)
+    if not _JSONPATH_SYNTAX.search(path.lstrip("$")):
+        # A plain dotted path such as "paths./users.get.responses.200"
+        # needs no JSONPath engine
+        _manual_set_path(spec, parts, value)
+        return
+    
     # Convert OpenAPI-style path to jsonpath-ng format
     # e.g., "paths./users.get.responses.200" -> "paths['/users'].get.responses['200']"
-    normalized_path = _normalize_jsonpath(path)
-    
     try:
-        jsonpath_expr = parse_jsonpath(normalized_path)
+        jsonpath_expr = _compile_path(path)
         jsonpath_expr.update_or_create(spec, value)
     except Exception:
         # Fallback: manual path navigation
-        _manual_set_path(spec, path, value)
+        _manual_set_path(spec, parts, value)
 
 
-def _normalize_jsonpath(path: str) -> str:
-    """Normalize a path for jsonpath-ng."""
-    # Simple normalization - handle common patterns
-    parts = path.strip("$.").split(".")
-    result_parts = []
-    
-    for part in parts:
-        if part.startswith("/"):
-            # Path segment like /users
-            result_parts.append(f"['{part}']")
-        elif part.isdigit():
-            # Numeric key (status code)
-            result_parts.append(f"['{part}']")
-        else:
-            result_parts.append(part)
-    
-    return "$.." + ".".join(result_parts) if result_parts else "$"
+# jsonpath-ng's parser is slow, and batches apply many updates at the
+# same few paths
+@lru_cache(maxsize=512)
+def _compile_path(path: str) -> Any:
+    """Normalize and parse a path, reusing earlier parses."""
+    return parse_jsonpath(_normalize_jsonpath(_split_path(path)))
+
+
+@lru_cache(maxsize=512)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Split a dotted path into its segments, dropping any "$." prefix."""
+    return tuple(path.strip("$.").split("."))
 
 
-def _manual_set_path(spec: dict[str, Any], path: str, value: Any) -> None:
-    """Manually set a value at a path (fallback)."""
-    parts = path.strip("$.").split(".")
+def _normalize_jsonpath(parts: tuple[str, ...]) -> str:
+    """Normalize a split path for jsonpath-ng."""
+    # Path segments like /users and numeric keys (status codes) need
+    # bracket quoting; everything else is a plain field name
+    if not parts:
+        return "$"
+    return "$.." + ".".join(
+        f"['{part}']" if _QUOTED_SEGMENT.match(part) else part for part in parts
+    )
+
+
+def _manual_set_path(spec: dict[str, Any], parts: tuple[str, ...], value: Any) -> None:
+    """Set a value at a split path, creating missing levels."""
     current = spec
     
-    for i, part in enumerate(parts[:-1]):
-        if part not in current:
-            current[part] = {}
-        current = current[part]
+    for part in parts[:-1]:
+        # One hash probe per level
+        current = current.setdefault(part, {})
     
     if parts:
         current[parts[-1]] = value
 
 
-def _deep_merge(base: dict[str, Any], updates: dict[str, Any]) -> None:
-    """Recursively merge updates into base dict."""
-    for key, value in updates.items():
-        if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-            _deep_merge(base[key], value)
-        else:
-            base[key] = copy.deepcopy(value)
+def _deep_merge(
+    base: dict[str, Any], updates: dict[str, Any], source: dict[str, Any] | None = None
+) -> None:
+    """Merge updates into base dict, recursing into nested dicts.
+    
+    Args:
+        base: The dict to merge into.
+        updates: The dict to merge.
+        source: The dict base is an unmodified copy of, if any. A value of
+            updates that is the very object source holds at that key is
+            already in base, so it is neither walked nor copied.
+    """
+    # Explicit stack of (base, updates, source) triples instead of
+    # recursion: no frame setup per nested level
+    stack = [(base, updates, base if source is None else source)]
+    push = stack.append
+    pop = stack.pop
+    clone = _fast_json_clone
+    while stack:
+        base, updates, source = pop()
+        if updates is base or updates is source:
+            continue
+        get = base.get
+        get_source = source.get
+        for key, value in updates.items():
+            value_cls = value.__class__
+            if value_cls is not dict and value_cls is not list:
+                base[key] = value
+                continue
+            
+            current = get(key)
+            if current is None:
+                # New key: nothing to merge with
+                base[key] = clone(value)
+            elif current is value or value is get_source(key):
+                # A fragment built from the spec's own objects; nothing to do
+                continue
+            elif value_cls is dict and current.__class__ is dict:
+                if value:
+                    source_value = get_source(key)
+                    if source_value.__class__ is not dict:
+                        source_value = current
+                    push((current, value, source_value))
+            else:
+                # Containers are copied so the spec never aliases the fragment
+                base[key] = clone(value)
+
+
+def _clone_spec(spec: dict[str, Any], json_clone: bool) -> dict[str, Any]:
+    """Deep-copy a spec, through orjson when requested and possible."""
+    if json_clone and jsonutil.HAS_ORJSON:
+        try:
+            cloned: dict[str, Any] = jsonutil.clone(spec)
+            return cloned
+        except TypeError:
+            # Integer status code keys, YAML timestamps, ...
+            pass
+    cloned = _fast_json_clone(spec)
+    return cloned
+
+
+def _fast_json_clone(value: Any) -> Any:
+    """Deep-copy JSON-shaped data.
+    
+    Specs are trees of dicts, lists and scalars, so the memo table and
+    per-type dispatch of copy.deepcopy are pure overhead here.
+    """
+    cls = value.__class__
+    # Scalar children are shared inline, saving a call per leaf
+    if cls is dict:
+        return {
+            key: item if item.__class__ in _IMMUTABLE_SCALARS else _fast_json_clone(item)
+            for key, item in value.items()
+        }
+    if cls is list:
+        return [
+            item if item.__class__ in _IMMUTABLE_SCALARS else _fast_json_clone(item)
+            for item in value
+        ]
+    if cls in _IMMUTABLE_SCALARS:
+        return value
+    # Anything else (e.g. YAML timestamps) takes the general path
+    return copy.deepcopy(value)
 
 
 def spec_to_yaml(spec: dict[str, Any]) -> str:
@@ -103,7 +270,21 @@ def spec_to_yaml(spec: dict[str, Any]) -> str:
     Returns:
         YAML-formatted string.
     """
-    return yaml.dump(spec, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    text: str = yaml.dump(spec, Dumper=SpecDumper, **_YAML_STYLE)
+    return text
+
+
+def spec_to_yaml_stream(spec: dict[str, Any], stream: IO[str]) -> None:
+    """Write a spec as YAML directly to a text stream.
+    
+    Same output as spec_to_yaml(), without building the whole document
+    as one string first.
+    
+    Args:
+        spec: OpenAPI specification dict.
+        stream: Writable text stream, e.g. an open file.
+    """
+    yaml.dump(spec, stream, Dumper=SpecDumper, **_YAML_STYLE)
 
 
 def generate_diff_output(
@@ -112,35 +293,73 @@ def generate_diff_output(
 ) -> str:
     """Generate a human-readable diff between specs.
     
+    Top-level sections rendered for an earlier diff reuse their YAML, so
+    diffing one original against many candidate updates renders its
+    unchanged sections once.
+    
     Args:
         original_spec: Original specification.
         updated_spec: Updated specification.
         
     Returns:
-        Diff-like output string.
+        Unified diff of the specs' YAML, or "No changes detected".
     """
-    original_yaml = spec_to_yaml(original_spec)
-    updated_yaml = spec_to_yaml(updated_spec)
-    
-    # Simple line-by-line diff
-    original_lines = original_yaml.splitlines()
-    updated_lines = updated_yaml.splitlines()
-    
-    diff_lines = []
+    original_lines = _sectioned_yaml_lines(original_spec)
+    updated_lines = _sectioned_yaml_lines(updated_spec)
     
-    # Very simple diff - just show added/removed
-    original_set = set(original_lines)
-    updated_set = set(updated_lines)
-    
-    for line in original_lines:
-        if line not in updated_set:
-            diff_lines.append(f"- {line}")
+    diff_lines = difflib.unified_diff(
+        original_lines,
+        updated_lines,
+        fromfile="original",
+        tofile="updated",
+        lineterm="",
+    )
+    return "\n".join(diff_lines) or "No changes detected"
+
+
+def _sectioned_yaml_lines(spec: dict[str, Any]) -> list[str]:
+    """Render a spec's YAML lines one top-level section at a time.
     
-    for line in updated_lines:
-        if line not in original_set:
-            diff_lines.append(f"+ {line}")
+    Each section's YAML is cached under a 16-byte digest of its exact JSON
+    encoding, which orjson produces far faster than the YAML itself, so a
+    section an update did not touch (components, usually most of the
+    paths) is not rendered again. Objects shared between places are
+    written out in full rather than as YAML aliases, so the concatenated
+    sections read as one document. Specs that are not plain JSON (integer
+    status code keys, YAML timestamps, ...) are rendered whole with
+    spec_to_yaml().
+    """
+    try:
+        keys = [
+            hashlib.blake2b(jsonutil.fingerprint({name: value}), digest_size=16).digest()
+            for name, value in spec.items()
+        ]
+    except (TypeError, ValueError):
+        keys = []
+    if not keys:
+        return spec_to_yaml(spec).splitlines()
     
-    return "\n".join(diff_lines) if diff_lines else "No changes detected"
+    lines: list[str] = []
+    for key, (name, value) in zip(keys, spec.items()):
+        text = _section_yaml_cache.get(key)
+        if text is None:
+            text = yaml.dump({name: value}, Dumper=_ExpandingDumper, **_YAML_STYLE)
+            if len(_section_yaml_cache) >= SECTION_CACHE_SIZE:
+                # Evict the oldest entry
+                del _section_yaml_cache[next(iter(_section_yaml_cache))]
+            _section_yaml_cache[key] = text
+        lines.extend(text.splitlines())
+    return lines
+
+
+_section_yaml_cache: dict[bytes, str] = {}
+
+
+class _ExpandingDumper(SpecDumper):
+    """SpecDumper that writes repeated objects out instead of aliasing them."""
+
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
 
 
 def save_spec(spec: dict[str, Any], file_path: str) -> None:
@@ -151,4 +370,4 @@ def save_spec(spec: dict[str, Any], file_path: str) -> None:
         file_path: Path to save to.
     """
     with open(file_path, "w", encoding="utf-8") as f:
-        yaml.dump(spec, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        spec_to_yaml_stream(spec, f)
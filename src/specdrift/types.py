@@ -1,13 +1,30 @@
 """Core type definitions for SpecDrift Agent.
 
-All types use Pydantic for validation and structured LLM output.
+All types use Pydantic for validation and structured LLM output, except
+Anomaly: the diff engine creates one per finding, so it is a slotted
+dataclass that Pydantic models embed and serialize as usual.
 """
 
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    ConfigDict,
+    Field,
+    GetCoreSchemaHandler,
+    PrivateAttr,
+    TypeAdapter,
+    computed_field,
+    field_serializer,
+    model_validator,
+)
+from pydantic_core import CoreSchema, core_schema
 
 
 # ============================================================================
@@ -15,7 +32,7 @@ from pydantic import BaseModel, Field
 # ============================================================================
 
 
-class HttpMethod(str, Enum):
+class HttpMethod(StrEnum):
     """Supported HTTP methods."""
 
     GET = "GET"
@@ -27,7 +44,14 @@ class HttpMethod(str, Enum):
     OPTIONS = "OPTIONS"
 
 
-class AnomalyType(str, Enum):
+class HttpTransport(StrEnum):
+    """HTTP transports available for executing requests."""
+
+    HTTPX = "httpx"
+    AIOHTTP = "aiohttp"
+
+
+class AnomalyType(StrEnum):
     """Types of anomalies detected by the diff engine."""
 
     TYPE_MISMATCH = "TYPE_MISMATCH"
@@ -37,8 +61,13 @@ class AnomalyType(str, Enum):
     STATUS_CODE_MISMATCH = "STATUS_CODE_MISMATCH"
     OPTIONALITY_DRIFT = "OPTIONALITY_DRIFT"
 
+    # Enum.__hash__ hashes the member name in Python code; names equal
+    # values here, so the C-level str hash gives the same result faster
+    # when anomalies are counted and grouped by type
+    __hash__ = str.__hash__
 
-class DecisionType(str, Enum):
+
+class DecisionType(StrEnum):
     """Decision classifications for spec drift."""
 
     UPDATE_SPEC = "UPDATE_SPEC"
@@ -46,7 +75,7 @@ class DecisionType(str, Enum):
     NEEDS_REVIEW = "NEEDS_REVIEW"
 
 
-class ChangeType(str, Enum):
+class ChangeType(StrEnum):
     """Types of spec changes that can be proposed."""
 
     ADD_ENUM_VALUE = "ADD_ENUM_VALUE"
@@ -66,6 +95,8 @@ class ChangeType(str, Enum):
 class RequestConfig(BaseModel):
     """Configuration for an HTTP request to be executed."""
 
+    model_config = ConfigDict(frozen=True)
+
     method: HttpMethod
     url: str
     path_params: dict[str, str] = Field(default_factory=dict)
@@ -75,15 +106,71 @@ class RequestConfig(BaseModel):
     auth_token: str | None = None
 
 
+class AnalysisTarget(BaseModel):
+    """An endpoint to analyze in a batch run."""
+
+    model_config = ConfigDict(frozen=True)
+
+    path: str
+    method: HttpMethod = HttpMethod.GET
+    expected_status: int = Field(
+        default=200,
+        validation_alias=AliasChoices("expected_status", "status"),
+    )
+
+
+def _from_timestamp_ns(timestamp_ns: int) -> datetime:
+    """Convert a time.time_ns() reading to a local datetime."""
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+
+
+def _timestamp_as_ns(data: Any) -> Any:
+    """Convert a timestamp given on model input to timestamp_ns.
+
+    timestamp is a computed field, so without this a timestamp passed in,
+    or read back from a dumped model, would be replaced by the current time.
+    """
+    if isinstance(data, dict) and "timestamp" in data and "timestamp_ns" not in data:
+        data = dict(data)
+        timestamp = _DATETIME.validate_python(data.pop("timestamp"))
+        # Whole seconds and microseconds separately: a float timestamp
+        # would round the microseconds
+        seconds = int(timestamp.replace(microsecond=0).timestamp())
+        data["timestamp_ns"] = seconds * 1_000_000_000 + timestamp.microsecond * 1000
+    return data
+
+
+_DATETIME = TypeAdapter(datetime)
+
+
 class RecordedResponse(BaseModel):
     """A recorded API response with metadata."""
 
+    model_config = ConfigDict(frozen=True)
+
     status_code: int
     headers: dict[str, str]
     body: Any
     response_time_ms: float
-    timestamp: datetime = Field(default_factory=datetime.now)
+    # Recorded as a cheap integer clock read; see the timestamp property
+    timestamp_ns: int = Field(default_factory=time.time_ns, exclude=True)
     request_config: RequestConfig
+    body_size: int | None = Field(
+        default=None,
+        description="Size of the body in bytes after content decoding, when recorded",
+    )
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def timestamp(self) -> datetime:
+        """When the response was recorded, in local time."""
+        return _from_timestamp_ns(self.timestamp_ns)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _timestamp_input(cls, data: Any) -> Any:
+        return _timestamp_as_ns(data)
 
 
 # ============================================================================
@@ -91,24 +178,105 @@ class RecordedResponse(BaseModel):
 # ============================================================================
 
 
-class Anomaly(BaseModel):
-    """A detected anomaly between spec and response."""
+@dataclass(slots=True, eq=False, init=False)
+class Anomaly:
+    """A detected anomaly between spec and response.
+
+    Compares and hashes by identity; compare as_dict() results instead.
+    Accepts a ready-made ``message`` in place of a template, as does
+    validation of a dumped anomaly.
+    """
 
     anomaly_type: AnomalyType
-    json_path: str = Field(description="JSON path to the anomalous field")
-    expected: Any = Field(description="What the spec declares")
-    actual: Any = Field(description="What was observed in the response")
-    message: str = Field(description="Human-readable description")
+    # JSON path to the anomalous field
+    json_path: str
+    # What the spec declares
+    expected: Any
+    # What was observed in the response
+    actual: Any
+    # Human-readable description as a str.format() template and its
+    # arguments. Most anomalies are never displayed, so the text is only
+    # rendered when the message property is read.
+    message_template: str
+    message_args: tuple[Any, ...] = ()
+
+    def __init__(
+        self,
+        anomaly_type: AnomalyType,
+        json_path: str,
+        expected: Any,
+        actual: Any,
+        message_template: str | None = None,
+        message_args: tuple[Any, ...] = (),
+        message: str | None = None,
+    ) -> None:
+        self.anomaly_type = anomaly_type
+        self.json_path = json_path
+        self.expected = expected
+        self.actual = actual
+        if message_template is None:
+            if message is None:
+                raise TypeError("Anomaly() needs message_template or message")
+            # A rendered message is its own template; without arguments
+            # it is returned as is, braces included
+            message_template, message_args = message, ()
+        self.message_template = message_template
+        self.message_args = message_args
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: type[Any], handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        # Dumped anomalies (see AnomalySummary) carry the rendered message
+        # instead of the template
+        return core_schema.no_info_before_validator_function(
+            _message_as_template, handler(source)
+        )
+
+    @property
+    def message(self) -> str:
+        """Human-readable description."""
+        if not self.message_args:
+            return self.message_template
+        return self.message_template.format(*self.message_args)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Convert to a plain dict, with the message rendered."""
+        return {
+            "anomaly_type": self.anomaly_type,
+            "json_path": self.json_path,
+            "expected": self.expected,
+            "actual": self.actual,
+            "message": self.message,
+        }
+
+
+def _message_as_template(data: Any) -> Any:
+    """Map the message of a dumped anomaly back to its template."""
+    if isinstance(data, dict) and "message" in data and "message_template" not in data:
+        data = dict(data)
+        data["message_template"] = data.pop("message")
+    return data
 
 
 class AnomalySummary(BaseModel):
     """Aggregated summary of all anomalies for LLM consumption."""
 
+    model_config = ConfigDict(frozen=True)
+
     total_anomalies: int
     anomalies_by_type: dict[AnomalyType, int]
     anomalies: list[Anomaly]
     response_sample: Any = Field(description="Sample response that triggered anomalies")
 
+    # Prompt rendering of the anomalies, cached by prompt_builder.format_anomalies
+    _anomalies_text: str | None = PrivateAttr(default=None)
+
+    @field_serializer("anomalies")
+    def _serialize_anomalies(self, anomalies: list[Anomaly]) -> list[dict[str, Any]]:
+        # message is a property, not a dataclass field
+        return [anomaly.as_dict() for anomaly in anomalies]
+
 
 # ============================================================================
 # LLM Decision Types (Strict Schema for LLM Output)
@@ -118,6 +286,8 @@ class AnomalySummary(BaseModel):
 class ChangeInstruction(BaseModel):
     """A single proposed change to the OpenAPI spec."""
 
+    model_config = ConfigDict(frozen=True)
+
     change_type: ChangeType
     json_path: str = Field(description="JSON path in the OpenAPI spec to modify")
     reason: str = Field(description="Explanation for this change")
@@ -130,6 +300,8 @@ class LLMDecision(BaseModel):
     This is the EXACT schema that the LLM must produce.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     decision: DecisionType
     confidence: float = Field(ge=0.0, le=1.0, description="Confidence score 0.0-1.0")
     proposed_changes: list[ChangeInstruction] = Field(default_factory=list)
@@ -151,15 +323,29 @@ class LLMDecision(BaseModel):
 class DriftReport(BaseModel):
     """Final output of the SpecDrift analysis."""
 
+    model_config = ConfigDict(frozen=True)
+
     endpoint: str
     spec_path: str
-    timestamp: datetime = Field(default_factory=datetime.now)
+    # Recorded as a cheap integer clock read; see the timestamp property
+    timestamp_ns: int = Field(default_factory=time.time_ns, exclude=True)
     anomaly_summary: AnomalySummary | None = None
     llm_decision: LLMDecision | None = None
     has_drift: bool = False
     auto_update_recommended: bool = False
     updated_spec_fragment: dict[str, Any] | None = None
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def timestamp(self) -> datetime:
+        """When the report was created, in local time."""
+        return _from_timestamp_ns(self.timestamp_ns)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _timestamp_input(cls, data: Any) -> Any:
+        return _timestamp_as_ns(data)
+
 
 # ============================================================================
 # OpenAPI Parser Types
@@ -169,23 +355,62 @@ class DriftReport(BaseModel):
 class ParsedEndpoint(BaseModel):
     """A parsed endpoint from the OpenAPI spec."""
 
+    model_config = ConfigDict(frozen=True)
+
     path: str
     method: HttpMethod
     operation_id: str | None = None
     request_schema: dict[str, Any] | None = None
-    response_schemas: dict[int, dict[str, Any]] = Field(
+    response_schemas: Mapping[int, dict[str, Any]] = Field(
         default_factory=dict,
         description="Response schemas keyed by status code",
     )
     parameters: list[dict[str, Any]] = Field(default_factory=list)
+    raw_operation: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Operation object as written in the spec, with $refs unresolved",
+    )
+
+    # Path split into segments once, with None for template parameters
+    # such as "{user_id}"
+    _path_segments: tuple[str | None, ...] = PrivateAttr(default=())
+    # Serialized OpenAPI fragment for LLM prompts, cached by the pipeline
+    _fragment_json: str | None = PrivateAttr(default=None)
+    # Documented response status codes, cached by the pipeline
+    _status_codes: frozenset[int] | None = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute the path segments used for path matching."""
+        self._path_segments = tuple(
+            None if segment.startswith("{") and segment.endswith("}") else segment
+            for segment in self.path.strip("/").split("/")
+        )
+
+    @property
+    def path_segments(self) -> tuple[str | None, ...]:
+        """Path segments, with None for template parameters."""
+        return self._path_segments
 
 
 class ParsedSpec(BaseModel):
     """A parsed OpenAPI specification."""
 
+    model_config = ConfigDict(frozen=True)
+
     openapi_version: str
     title: str
     version: str
     endpoints: list[ParsedEndpoint]
     components: dict[str, Any] = Field(default_factory=dict)
     raw_spec: dict[str, Any] = Field(description="Original spec for updates")
+
+    # Endpoints grouped by (method, path segment count), built on first
+    # lookup by openapi_parser.find_matching_endpoint
+    _endpoint_index: dict[tuple[HttpMethod, int], list[ParsedEndpoint]] | None = PrivateAttr(
+        default=None
+    )
+    # Endpoints by (path without surrounding slashes, method), built on
+    # first lookup by openapi_parser.find_matching_endpoint
+    _endpoints_by_key: dict[tuple[str, HttpMethod], ParsedEndpoint] | None = PrivateAttr(
+        default=None
+    )
@@ -1,7 +1,19 @@
 """Integration tests for the OpenAPI parser."""
 
+import json
+
 import pytest
-from specdrift.modules.openapi_parser import parse_spec, get_endpoint_schema, resolve_refs
+import yaml
+
+from specdrift.modules.openapi_parser import (
+    find_matching_endpoint,
+    get_endpoint_schema,
+    load_document,
+    load_spec_from_file,
+    parse_spec,
+    resolve_refs,
+)
+from specdrift.modules.pipeline import spec_targets
 from specdrift.types import HttpMethod
 
 
@@ -127,3 +139,236 @@ class TestOpenAPIParser:
         assert "items" in schema
         # $ref should be resolved
         assert schema["items"].get("type") == "object"
+
+    def test_find_matching_endpoint_by_method_and_depth(self):
+        """Lookups only match endpoints with the same method and depth."""
+        parsed = parse_spec(SAMPLE_SPEC)
+        
+        match = find_matching_endpoint(parsed, "/users/42", HttpMethod.GET)
+        
+        assert match is not None and match.operation_id == "getUser"
+        assert find_matching_endpoint(parsed, "/users/42", HttpMethod.POST) is None
+        assert find_matching_endpoint(parsed, "/users/42/status", HttpMethod.GET) is None
+        assert find_matching_endpoint(parsed, "/items/", HttpMethod.GET) is not None
+
+    def test_concrete_path_matches_before_template(self):
+        """A concrete spec path wins over a template declared before it."""
+        spec = {
+            "openapi": "3.0.0",
+            "info": {"title": "Paths", "version": "1.0.0"},
+            "paths": {
+                "/users/{user_id}": {"get": {"operationId": "getUser", "responses": {}}},
+                "/users/me": {"get": {"operationId": "getMe", "responses": {}}},
+            },
+        }
+        parsed = parse_spec(spec)
+        
+        assert find_matching_endpoint(parsed, "/users/me", HttpMethod.GET).operation_id == "getMe"
+        assert find_matching_endpoint(parsed, "/users/7", HttpMethod.GET).operation_id == "getUser"
+
+    def test_shared_refs_resolved_once(self):
+        """Every reference to a component shares one resolved schema."""
+        spec = {
+            "components": {
+                "schemas": {
+                    "Item": {"type": "object", "properties": {"id": {"type": "integer"}}},
+                },
+            },
+        }
+        cache: dict = {}
+        
+        first = resolve_refs({"$ref": "#/components/schemas/Item"}, spec, cache)
+        second = resolve_refs(
+            {"type": "array", "items": {"$ref": "#/components/schemas/Item"}}, spec, cache
+        )
+        
+        assert second["items"] is first
+
+    def test_endpoints_share_resolved_schemas(self):
+        """Endpoints referencing one component hold the same schema object."""
+        spec = {
+            "openapi": "3.0.0",
+            "info": {"title": "Shared", "version": "1.0.0"},
+            "components": {"schemas": {"Item": {"type": "object"}}},
+            "paths": {
+                path: {"get": {"responses": {"200": {"content": {"application/json": {
+                    "schema": {"$ref": "#/components/schemas/Item"},
+                }}}}}}
+                for path in ("/a", "/b")
+            },
+        }
+        
+        first, second = parse_spec(spec).endpoints
+        
+        assert first.response_schemas[200] is second.response_schemas[200]
+
+    def test_response_schemas_resolved_on_access(self):
+        """Only the response schemas that are read get resolved."""
+        spec = {
+            "openapi": "3.0.0",
+            "info": {"title": "Lazy", "version": "1.0.0"},
+            "components": {"schemas": {"Item": {"type": "object"}}},
+            "paths": {"/items": {"get": {"responses": {
+                "200": {"content": {"application/json": {
+                    "schema": {"$ref": "#/components/schemas/Item"},
+                }}},
+                "404": {"content": {"application/json": {
+                    "schema": {"$ref": "#/components/schemas/Missing"},
+                }}},
+            }}}},
+        }
+        
+        endpoint = parse_spec(spec).endpoints[0]
+        
+        assert list(endpoint.response_schemas) == [200, 404]
+        assert endpoint.response_schemas[200] == {"type": "object"}
+        with pytest.raises(ValueError, match="Cannot resolve reference"):
+            endpoint.response_schemas[404]
+
+    def test_ref_free_subtrees_not_copied(self):
+        """Only the path down to a $ref is rebuilt."""
+        spec = {"components": {"schemas": {"Item": {"type": "integer"}}}}
+        name = {"type": "string"}
+        schema = {
+            "type": "object",
+            "properties": {"name": name, "item": {"$ref": "#/components/schemas/Item"}},
+        }
+        
+        resolved = resolve_refs(schema, spec)
+        
+        assert resolved is not schema
+        assert resolved["properties"]["name"] is name
+        assert resolved["properties"]["item"] == {"type": "integer"}
+        assert resolve_refs(name, spec) is name
+
+    def test_recursive_ref_resolves_to_cycle(self):
+        """A self-referencing component does not recurse forever."""
+        spec = {
+            "components": {
+                "schemas": {
+                    "Node": {
+                        "type": "object",
+                        "properties": {"children": {
+                            "type": "array",
+                            "items": {"$ref": "#/components/schemas/Node"},
+                        }},
+                    },
+                },
+            },
+        }
+        
+        node = resolve_refs({"$ref": "#/components/schemas/Node"}, spec)
+        
+        assert node["properties"]["children"]["items"] is node
+
+    def test_recursive_ref_with_sibling_keys(self):
+        """A recursive $ref with sibling keys keeps the referenced schema."""
+        spec = {
+            "components": {
+                "schemas": {
+                    "Node": {
+                        "type": "object",
+                        "properties": {"child": {
+                            "$ref": "#/components/schemas/Node",
+                            "description": "kid",
+                        }},
+                    },
+                },
+            },
+        }
+        
+        node = resolve_refs({"$ref": "#/components/schemas/Node"}, spec)
+        child = node["properties"]["child"]
+        
+        assert child["description"] == "kid"
+        assert child["type"] == "object"
+        assert child["properties"]["child"] is child
+
+    def test_json_spec_matches_yaml_spec(self):
+        """JSON specs bypass YAML and parse to the same endpoints."""
+        document = yaml.safe_load(SAMPLE_SPEC)
+        
+        from_json = parse_spec(json.dumps(document))
+        
+        assert from_json.endpoints == parse_spec(SAMPLE_SPEC).endpoints
+
+    def test_yaml_flow_mapping_still_parses(self):
+        """A document that only looks like JSON falls back to YAML."""
+        assert load_document("{openapi: 3.0.3}") == {"openapi": "3.0.3"}
+        assert load_document('{"a": 1}', loader=yaml.SafeLoader) == {"a": 1}
+
+
+class TestSpecCache:
+    """Tests for the on-disk spec cache."""
+
+    def test_warm_load_matches_cold_load(self, tmp_path):
+        """A cached spec parses to the same endpoints as a fresh one."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(SAMPLE_SPEC, encoding="utf-8")
+        cache_dir = tmp_path / "cache"
+        
+        cold = load_spec_from_file(str(spec_file), cache_dir=cache_dir)
+        assert len(list((cache_dir / "specs").iterdir())) == 1
+        warm = load_spec_from_file(str(spec_file), cache_dir=cache_dir)
+        
+        assert warm.endpoints == cold.endpoints
+        assert get_endpoint_schema(warm, "/users/1", HttpMethod.GET, 200) is not None
+
+    def test_changed_file_misses_cache(self, tmp_path):
+        """Editing the spec file invalidates its cache entry."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(SAMPLE_SPEC, encoding="utf-8")
+        cache_dir = tmp_path / "cache"
+        load_spec_from_file(str(spec_file), cache_dir=cache_dir)
+        
+        spec_file.write_text(SAMPLE_SPEC.replace("Test API", "Renamed API"), encoding="utf-8")
+        parsed = load_spec_from_file(str(spec_file), cache_dir=cache_dir)
+        
+        assert parsed.title == "Renamed API"
+
+    def test_unchanged_file_reuses_parsed_spec(self, tmp_path):
+        """Loading an unchanged file twice in one process parses it once."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(SAMPLE_SPEC, encoding="utf-8")
+        
+        first = load_spec_from_file(str(spec_file))
+        
+        assert load_spec_from_file(str(spec_file)) is first
+
+
+class TestSpecTargets:
+    """Tests for picking the endpoints a spec-wide run calls."""
+
+    def test_required_parameters_exclude_endpoints(self):
+        """Path item and $ref'd required parameters count, unless overridden."""
+        ok = {"200": {"description": "OK", "content": {"application/json": {"schema": {}}}}}
+        spec = {
+            "openapi": "3.0.3",
+            "info": {"title": "API", "version": "1"},
+            "paths": {
+                "/plain": {"get": {"responses": ok}},
+                "/path-level": {
+                    "parameters": [{"name": "q", "in": "query", "required": True}],
+                    "get": {"responses": ok},
+                },
+                "/overridden": {
+                    "parameters": [{"name": "q", "in": "query", "required": True}],
+                    "get": {
+                        "parameters": [{"name": "q", "in": "query", "required": False}],
+                        "responses": ok,
+                    },
+                },
+                "/referenced": {
+                    "get": {
+                        "parameters": [{"$ref": "#/components/parameters/Q"}],
+                        "responses": ok,
+                    },
+                },
+            },
+            "components": {"parameters": {"Q": {"name": "q", "in": "query", "required": True}}},
+        }
+        
+        targets = spec_targets(parse_spec(json.dumps(spec)))
+        
+        assert [target.path for target in targets] == ["/plain", "/overridden"]
+
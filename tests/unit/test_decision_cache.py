@@ -0,0 +1,53 @@
+"""Unit tests for the LLM decision cache."""
+
+import asyncio
+
+from specdrift.modules.diff_engine import compare_response_to_schema, summarize_anomalies
+from specdrift.modules.semantic_reconciler.decision_cache import (
+    decision_key,
+    load_cached_decision,
+    store_cached_decision,
+)
+from specdrift.modules.semantic_reconciler.llm_client import DEFAULT_MODEL, reconcile_with_llm
+from specdrift.modules.semantic_reconciler.prompt_builder import (
+    build_reconciliation_prompt,
+    get_system_prompt,
+    serialize_fragment,
+)
+from specdrift.types import DecisionType, LLMDecision
+
+
+class TestDecisionCache:
+    """Tests for caching LLM decisions by prompt."""
+
+    def test_round_trip(self, tmp_path):
+        """A stored decision loads back unchanged."""
+        decision = LLMDecision(decision=DecisionType.API_BUG, confidence=0.9)
+        key = decision_key("model", "system", "user")
+        
+        assert load_cached_decision(key, tmp_path) is None
+        store_cached_decision(key, tmp_path, decision)
+        
+        assert load_cached_decision(key, tmp_path) == decision
+        assert decision_key("model", "system", "user2") != key
+
+    def test_cached_decision_skips_llm(self, tmp_path, monkeypatch):
+        """An identical prompt is answered from the cache, without an API key."""
+        monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+        anomalies = compare_response_to_schema({"extra": 1}, 200, {"type": "object"})
+        summary = summarize_anomalies(anomalies, {"extra": 1})
+        fragment = {"paths": {"/x": {"get": {}}}}
+        prompt = build_reconciliation_prompt(fragment, summary, "GET /x")
+        decision = LLMDecision(decision=DecisionType.UPDATE_SPEC, confidence=0.95)
+        store_cached_decision(
+            decision_key(DEFAULT_MODEL, get_system_prompt(), prompt), tmp_path, decision
+        )
+        
+        result = asyncio.run(
+            reconcile_with_llm(fragment, summary, "GET /x", cache_dir=tmp_path)
+        )
+        
+        assert result == decision
+        # A pre-serialized fragment builds the same prompt
+        serialized = serialize_fragment(fragment)
+        assert build_reconciliation_prompt(serialized, summary, "GET /x") == prompt
@@ -1,14 +1,32 @@
 """Unit tests for the Diff Engine."""
 
+import sys
+import threading
+from datetime import datetime
+
 import pytest
 
-from specdrift.types import AnomalyType
-from specdrift.modules.diff_engine import compare_response_to_schema, summarize_anomalies
+from specdrift.types import Anomaly, AnomalyType, DriftReport
+from specdrift.modules.diff_engine import (
+    CompiledSchema,
+    build_validator,
+    compare_response_to_schema,
+    compile_schema,
+    summarize_anomalies,
+)
+from specdrift.modules.diff_engine.codegen import get_hot_validator
+from specdrift.modules.diff_engine.compile import get_compiled
 from specdrift.modules.diff_engine.detectors.type_detector import detect_type_mismatches
 from specdrift.modules.diff_engine.detectors.required_detector import detect_missing_required
 from specdrift.modules.diff_engine.detectors.additional_detector import detect_additional_fields
 from specdrift.modules.diff_engine.detectors.enum_detector import detect_enum_violations
 from specdrift.modules.diff_engine.detectors.status_detector import detect_status_mismatch
+from specdrift.modules.diff_engine.walker import walk
+
+
+def _dicts(anomalies):
+    """Anomalies compare by identity; compare their contents instead."""
+    return [anomaly.as_dict() for anomaly in anomalies]
 
 
 class TestTypeDetector:
@@ -44,6 +62,24 @@ class TestTypeDetector:
         assert len(anomalies) == 1
         assert anomalies[0].anomaly_type == AnomalyType.TYPE_MISMATCH
 
+    def test_number_accepts_integer_but_not_boolean(self):
+        """Integers are numbers; booleans are not."""
+        schema = {"type": "number"}
+        assert detect_type_mismatches(3, schema, "$") == []
+        assert detect_type_mismatches(2.5, schema, "$") == []
+        assert len(detect_type_mismatches(True, schema, "$")) == 1
+
+    def test_integer_rejects_boolean(self):
+        """bool is an int subclass in Python but not an OpenAPI integer."""
+        anomalies = detect_type_mismatches(False, {"type": "integer"}, "$")
+        assert len(anomalies) == 1
+
+    def test_dict_subclass_matches_object(self):
+        """Non-JSON subclasses still match through the isinstance fallback."""
+        from collections import OrderedDict
+        
+        assert detect_type_mismatches(OrderedDict(a=1), {"type": "object"}, "$") == []
+
     def test_nullable_null_value(self):
         """Null value is allowed when nullable is true."""
         schema = {"type": "string", "nullable": True}
@@ -118,6 +154,19 @@ class TestRequiredDetector:
         anomalies = detect_missing_required(value, schema, "$")
         assert len(anomalies) == 1
 
+    def test_nullable_required_field(self):
+        """No anomaly when a required field is null but declared nullable."""
+        schema = {
+            "type": "object",
+            "required": ["name", "nickname"],
+            "properties": {
+                "name": {"type": "string", "nullable": True},
+                "nickname": {"type": ["string", "null"]},
+            }
+        }
+        value = {"name": None, "nickname": None}
+        assert detect_missing_required(value, schema, "$") == []
+
 
 class TestAdditionalDetector:
     """Tests for additional field detection."""
@@ -148,6 +197,19 @@ class TestAdditionalDetector:
         assert anomalies[0].anomaly_type == AnomalyType.ADDITIONAL_FIELD
         assert "metadata" in anomalies[0].json_path
 
+    def test_additional_properties_schema_documents_fields(self):
+        """Fields covered by an additionalProperties schema are not flagged."""
+        schema = {
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+            "additionalProperties": {"type": "integer"},
+        }
+        value = {"name": "John", "apples": 3, "pears": "many"}
+        
+        assert detect_additional_fields(value, schema, "$") == []
+        anomalies = detect_type_mismatches(value, schema, "$")
+        assert [a.json_path for a in anomalies] == ["$.pears"]
+
 
 class TestEnumDetector:
     """Tests for enum violation detection."""
@@ -159,6 +221,13 @@ class TestEnumDetector:
         anomalies = detect_enum_violations(value, schema, "$")
         assert len(anomalies) == 0
 
+    def test_unhashable_values(self):
+        """Objects and arrays are compared against enums without errors."""
+        assert len(detect_enum_violations({"a": 1}, {"enum": ["a"]}, "$")) == 1
+        assert detect_enum_violations([1, 2], {"enum": [[1, 2], "x"]}, "$") == []
+        validate = build_validator({"enum": ["a"]})
+        assert validate({"a": 1})[0].anomaly_type == AnomalyType.ENUM_VIOLATION
+
     def test_invalid_enum_value(self):
         """Anomaly when value not in enum."""
         schema = {"type": "string", "enum": ["active", "inactive"]}
@@ -182,6 +251,155 @@ class TestStatusDetector:
         assert len(anomalies) == 1
         assert anomalies[0].anomaly_type == AnomalyType.STATUS_CODE_MISMATCH
 
+    def test_status_set_reported_in_order(self):
+        """A frozenset of status codes is accepted and reported sorted."""
+        assert detect_status_mismatch(404, frozenset({200, 404})) == []
+        anomalies = detect_status_mismatch(422, frozenset({404, 200}))
+        assert anomalies[0].expected == "One of: [200, 404]"
+
+
+class TestSchemaCompiler:
+    """Tests for schema pre-compilation."""
+
+    def test_compile_normalizes_keywords(self):
+        """Type lists, required and nested schemas are normalized once."""
+        schema = {
+            "type": "object",
+            "required": ["id", "id", "tags"],
+            "properties": {
+                "id": {"type": ["integer", "null"]},
+                "tags": {"type": "array", "items": {"type": "string"}},
+            },
+        }
+        node = compile_schema(schema)
+        
+        assert node.type_names == frozenset({"object"})
+        assert node.required == ("id", "tags")
+        assert node.required_set == frozenset({"id", "tags"})
+        assert node.properties["id"].nullable
+        assert not node.properties["id"].rejects_null
+        assert node.properties["tags"].rejects_null
+        assert node.properties["tags"].items is not None
+        assert node.properties["tags"].items.type_names == frozenset({"string"})
+
+    def test_compiled_schema_accepted(self):
+        """A precompiled schema gives the same result as the raw dict."""
+        schema = {"type": "object", "properties": {"count": {"type": "integer"}}}
+        response = {"count": True}
+        
+        raw = compare_response_to_schema(response, 200, schema)
+        compiled = compare_response_to_schema(response, 200, compile_schema(schema))
+        
+        assert [a.json_path for a in raw] == [a.json_path for a in compiled] == ["$.count"]
+
+    def test_equal_schemas_share_compiled_node(self):
+        """Equal schemas in different dicts are compiled once."""
+        def make_schema():
+            return {"type": "object", "properties": {"id": {"type": "integer"}}}
+
+        assert get_compiled(make_schema()) is get_compiled(make_schema())
+        reordered = {"properties": {"id": {"type": "integer"}}, "type": "object"}
+        assert get_compiled(reordered) is get_compiled(make_schema())
+        assert get_compiled({"enum": [1]}) is not get_compiled({"enum": [True]})
+
+
+class TestValidatorCodegen:
+    """Tests for schema-specialized generated validators."""
+
+    def test_generated_validator_matches_walker(self):
+        """Generated code reports the same anomalies, in order, as the walker."""
+        schema = {
+            "type": "object",
+            "required": ["id", "name", "email"],
+            "properties": {
+                "id": {"type": "integer"},
+                "name": {"type": "string"},
+                "email": {"type": "string"},
+                "status": {"type": "string", "enum": ["active", "inactive"]},
+                "tags": {"type": "array", "items": {"type": "string"}},
+                "meta": {"type": "object", "additionalProperties": {"type": "number"}},
+            },
+        }
+        responses = [
+            {"id": 1, "name": "Test", "email": "a@b.c"},
+            {"id": "1", "name": None, "status": "archived", "extra": True},
+            {"id": 1, "name": "x", "email": "y", "tags": ["a", 2, None], "meta": {"k": "v"}},
+            ["not", "an", "object"],
+        ]
+        validate = build_validator(schema)
+        node = compile_schema(schema)
+        for response in responses:
+            expected: list = []
+            walk(response, node, ("$",), expected)
+            assert _dicts(validate(response)) == _dicts(expected)
+
+    def test_recursive_schema_falls_back_on_deep_nesting(self):
+        """Responses too deep for generated code are walked iteratively."""
+        schema: dict = {"type": "object", "properties": {}}
+        schema["properties"]["child"] = schema
+        response: dict = {}
+        current = response
+        for _ in range(5000):
+            current["child"] = {"oops": 1}
+            current = current["child"]
+        
+        anomalies = build_validator(schema)(response)
+        assert len(anomalies) == 5000
+        assert all(a.anomaly_type == AnomalyType.ADDITIONAL_FIELD for a in anomalies)
+
+    def test_scalar_object_precheck_matches_walker(self):
+        """Objects of scalar fields report the same anomalies as the walker."""
+        schema = {
+            "type": "object",
+            "required": ["id", "name"],
+            "properties": {
+                "id": {"type": "integer"},
+                "name": {"type": "string"},
+                "note": {"type": "string", "nullable": True},
+            },
+        }
+        responses = [
+            {"id": 1, "name": "x", "note": None},
+            {"id": True, "name": None, "extra": 1},
+            {"name": "x", "note": 2},
+        ]
+        validate = build_validator(schema)
+        node = compile_schema(schema)
+        for response in responses:
+            expected: list = []
+            walk(response, node, ("$",), expected)
+            assert _dicts(validate(response)) == _dicts(expected)
+
+    def test_limit_stops_generated_validator(self):
+        """A limited validator returns the first anomalies the walker would."""
+        schema = {"type": "array", "items": {"type": "integer"}}
+        validate = build_validator(schema)
+        response = ["x"] * 100
+
+        assert _dicts(validate(response, "$", 10)) == _dicts(validate(response)[:10])
+        assert validate(response, "$", 0) == []
+
+    def test_hot_schema_switches_to_generated_validator(self):
+        """Repeated comparisons against a schema give the walker's results."""
+        schema = {
+            "type": "object",
+            "required": ["id"],
+            "properties": {"id": {"type": "integer"}, "tags": {"type": "array"}},
+        }
+        response = {"tags": "x", "extra": 1}
+        first = compare_response_to_schema(response, 500, schema, [200], max_anomalies=3)
+
+        node = get_compiled(schema)
+        for _ in range(100_000):
+            result = compare_response_to_schema(response, 500, schema, [200], max_anomalies=3)
+            if get_hot_validator(node) is not None:
+                break
+        result = compare_response_to_schema(response, 500, schema, [200], max_anomalies=3)
+
+        assert get_hot_validator(node) is not None
+        assert _dicts(result) == _dicts(first)
+        assert len(result) == 3
+
 
 class TestDiffEngine:
     """Tests for the main diff engine."""
@@ -213,6 +431,109 @@ class TestDiffEngine:
         
         assert len(anomalies) >= 2  # enum + additional
 
+    def test_deeply_nested_response(self):
+        """Traversal depth is not limited by the interpreter recursion limit."""
+        schema: dict = {"type": "array"}
+        schema["items"] = schema  # self-referencing, e.g. a tree of lists
+        response: list = ["leaf"]
+        for _ in range(5000):
+            response = [response]
+        
+        anomalies = compare_response_to_schema(response, 200, schema)
+        
+        assert len(anomalies) == 1
+        assert anomalies[0].json_path.endswith("[0]")
+
+    def test_max_anomalies_budget(self):
+        """Traversal stops once the anomaly budget is spent."""
+        schema = {"type": "array", "items": {"type": "integer"}}
+        response = ["x"] * 1000
+        
+        capped = compare_response_to_schema(response, 200, schema, max_anomalies=10)
+        uncapped = compare_response_to_schema(response, 200, schema, max_anomalies=None)
+        
+        assert len(capped) == 10
+        assert capped[-1].json_path == "$[9]"
+        assert len(uncapped) == 1000
+
+    def test_scalar_array_checked_in_bulk(self):
+        """Bulk-checked scalar arrays report exactly the failing items."""
+        schema = {"type": "array", "items": {"type": "integer", "enum": [1, 2]}}
+        node = compile_schema(schema)
+        validate = build_validator(schema)
+
+        for response in ([1, 2, 2], [1, True, 3, None, 2.0, "2"]):
+            expected: list = []
+            walk(response, node, ("$",), expected)
+            assert _dicts(validate(response)) == _dicts(expected)
+            assert _dicts(compare_response_to_schema(response, 200, schema)) == _dicts(expected)
+        assert [a.json_path for a in expected] == [
+            "$[1]", "$[2]", "$[3]", "$[3]", "$[4]", "$[5]", "$[5]"
+        ]
+
+    def test_compiled_schema_matches_compare(self):
+        """A CompiledSchema validates like compare_response_to_schema."""
+        schema = {"type": "object", "required": ["id"], "properties": {"id": {"type": "integer"}}}
+        compiled = CompiledSchema(schema, frozenset({200}), max_anomalies=1)
+
+        for body, status in (({"id": 1}, 200), ({"id": "x", "extra": 1}, 500), (None, 200)):
+            expected = compare_response_to_schema(body, status, schema, [200], max_anomalies=1)
+            assert _dicts(compiled.validate(body, status)) == _dicts(expected)
+        assert CompiledSchema({}).validate({"any": 1}, 200) == []
+
+    def test_memoized_results(self):
+        """Memoized comparisons reuse results for equal bodies only."""
+        schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+        compiled = CompiledSchema(schema, [200], memoize=True)
+
+        first = compiled.validate({"id": "x"}, 500)
+        again = compiled.validate({"id": "x"}, 500)
+
+        assert _dicts(again) == _dicts(first)
+        assert again[1] is not first[1]
+        assert compiled.validate({"id": 1}, 200) == []
+        assert len(compiled.validate({"id": True}, 200)) == 1
+        assert len(compare_response_to_schema({"id": "x"}, 200, schema, memoize=True)) == 1
+
+    def test_memoized_results_match_unmemoized(self):
+        """Bodies equal only after sorting keys or nulling NaN are not conflated."""
+        schema = {"type": "object", "properties": {"a": {"type": "string"}}}
+        compiled = CompiledSchema(schema, memoize=True)
+        plain = CompiledSchema(schema)
+
+        for body in (
+            {"a": float("nan")},
+            {"a": None},
+            {"c": 3, "b": 2, "a": 1},
+            {"a": 1, "b": 2, "c": 3},
+        ):
+            assert _dicts(compiled.validate(body, 200)) == _dicts(plain.validate(body, 200))
+
+    def test_concurrent_validation_with_full_caches(self):
+        """Threads validating against many schemas can evict cache entries together."""
+        errors: list[Exception] = []
+
+        def validate_many(thread: int) -> None:
+            try:
+                for i in range(400):
+                    schema = {"type": "object", "properties": {f"f{thread}_{i}": {}}}
+                    compare_response_to_schema({"x": 1}, 200, schema, memoize=True)
+            except Exception as e:
+                errors.append(e)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=validate_many, args=(t,)) for t in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert errors == []
+
     def test_summarize_anomalies(self):
         """Anomaly summarization works correctly."""
         schema = {"type": "string", "enum": ["a", "b"]}
@@ -222,3 +543,100 @@ class TestDiffEngine:
         
         assert summary.total_anomalies == 1
         assert AnomalyType.ENUM_VIOLATION in summary.anomalies_by_type
+        assert summary.anomalies[0] is anomalies[0]
+        dumped = summary.model_dump(mode="json")["anomalies"][0]
+        assert dumped["anomaly_type"] == "ENUM_VIOLATION"
+        assert dumped["message"] == anomalies[0].message
+        # Anomaly types still work as keys interchangeably with their names
+        assert summary.anomalies_by_type["ENUM_VIOLATION"] == 1
+
+    def test_message_rendered_from_template(self):
+        """Messages are formatted on demand, braces in values included."""
+        anomalies = detect_enum_violations("{x}", {"enum": ["a"]}, "$")
+        
+        assert anomalies[0].message == "Value '{x}' is not in allowed enum values ['a'] at $"
+
+    def test_dumped_report_validates_back(self):
+        """A dumped report loads back with the same anomalies."""
+        anomalies = compare_response_to_schema({"x": 5}, 200, {"properties": {}})
+        anomalies.append(
+            Anomaly(
+                anomaly_type=AnomalyType.STATUS_CODE_MISMATCH,
+                json_path="$",
+                expected=[200],
+                actual=500,
+                message="Status {500} not documented",
+            )
+        )
+        report = DriftReport(
+            endpoint="GET /users",
+            spec_path="spec.yaml",
+            anomaly_summary=summarize_anomalies(anomalies, {"x": 5}),
+        )
+
+        loaded = DriftReport.model_validate_json(report.model_dump_json())
+
+        assert loaded.anomaly_summary is not None
+        assert _dicts(loaded.anomaly_summary.anomalies) == _dicts(anomalies)
+        assert loaded.model_dump() == report.model_dump()
+
+    def test_timestamp_given_on_input_is_kept(self):
+        """A timestamp passed in or read back is not replaced by the current time."""
+        timestamp = datetime(2024, 5, 1, 12, 30, 15, 123456)
+        report = DriftReport(endpoint="GET /users", spec_path="spec.yaml", timestamp=timestamp)
+
+        assert report.timestamp == timestamp
+        assert DriftReport.model_validate_json(report.model_dump_json()).timestamp == timestamp
+        assert DriftReport.model_validate(report.model_dump()).timestamp == timestamp
+
+    def test_array_items_checked_for_every_anomaly_kind(self):
+        """A single traversal reports all anomaly kinds inside array items."""
+        schema = {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["id"],
+                "properties": {
+                    "id": {"type": "integer"},
+                    "status": {"type": "string", "enum": ["active"]},
+                },
+            },
+        }
+        response = [{"status": "gone", "extra": 1}, {"id": "x"}]
+        
+        anomalies = compare_response_to_schema(
+            response_body=response,
+            response_status=200,
+            schema=schema,
+        )
+        
+        found = {(a.anomaly_type, a.json_path) for a in anomalies}
+        assert found == {
+            (AnomalyType.MISSING_REQUIRED_FIELD, "$[0].id"),
+            (AnomalyType.ENUM_VIOLATION, "$[0].status"),
+            (AnomalyType.ADDITIONAL_FIELD, "$[0].extra"),
+            (AnomalyType.TYPE_MISMATCH, "$[1].id"),
+        }
+
+    def test_mismatched_values_still_get_other_checks(self):
+        """A null or mistyped value is still checked against enum and fields."""
+        schema = {
+            "type": "object",
+            "properties": {
+                "x": {"type": "string", "enum": ["a"]},
+                "meta": {"type": "string"},
+                "state": {"type": "string", "nullable": True, "enum": ["on"]},
+            },
+        }
+        response = {"x": 5, "meta": {"extra": 1}, "state": None}
+
+        anomalies = compare_response_to_schema(response, 200, schema)
+
+        assert [(a.anomaly_type, a.json_path) for a in anomalies] == [
+            (AnomalyType.TYPE_MISMATCH, "$.x"),
+            (AnomalyType.ENUM_VIOLATION, "$.x"),
+            (AnomalyType.TYPE_MISMATCH, "$.meta"),
+            (AnomalyType.ADDITIONAL_FIELD, "$.meta.extra"),
+            (AnomalyType.ENUM_VIOLATION, "$.state"),
+        ]
+        assert _dicts(build_validator(schema)(response)) == _dicts(anomalies)
@@ -0,0 +1,264 @@
+"""Unit tests for the Spec Updater."""
+
+import io
+
+from specdrift.modules.spec_updater import (
+    _compile_path,
+    _fast_json_clone,
+    _sectioned_yaml_lines,
+    apply_updates,
+    apply_updates_batch,
+    generate_diff_output,
+    spec_to_yaml,
+    spec_to_yaml_stream,
+)
+
+
+def _sample_spec():
+    return {
+        "openapi": "3.0.0",
+        "paths": {
+            "/users": {
+                "get": {
+                    "responses": {"200": {"description": "OK"}},
+                },
+            },
+        },
+    }
+
+
+class TestApplyUpdates:
+    """Tests for applying spec updates."""
+
+    def test_merge_fragment(self):
+        """A fragment without a path is merged into the spec."""
+        spec = _sample_spec()
+        updated = apply_updates(spec, {"paths": {"/users": {"get": {"summary": "List"}}}})
+
+        assert updated["paths"]["/users"]["get"]["summary"] == "List"
+        assert updated["paths"]["/users"]["get"]["responses"] == {"200": {"description": "OK"}}
+        # The original is left untouched
+        assert "summary" not in spec["paths"]["/users"]["get"]
+
+    def test_merge_nested_levels(self):
+        """Nested dicts are merged key by key at every level."""
+        spec = _sample_spec()
+        fragment = {
+            "paths": {
+                "/users": {
+                    "get": {"responses": {"404": {"description": "Missing"}}},
+                },
+            },
+        }
+
+        updated = apply_updates(spec, fragment)
+
+        assert updated["paths"]["/users"]["get"]["responses"] == {
+            "200": {"description": "OK"},
+            "404": {"description": "Missing"},
+        }
+
+    def test_merge_does_not_alias_fragment(self):
+        """Containers from the fragment are copied into the spec."""
+        fragment = {"tags": [{"name": "users"}], "info": {"title": "API"}}
+        updated = apply_updates(_sample_spec(), fragment)
+
+        assert updated["tags"] == fragment["tags"]
+        assert updated["tags"] is not fragment["tags"]
+        assert updated["info"] is not fragment["info"]
+
+    def test_empty_fragment_is_noop(self):
+        """An empty fragment returns the spec unchanged."""
+        spec = _sample_spec()
+
+        assert apply_updates(spec, {}) == spec
+        assert apply_updates(spec, {}, copy_spec=False) is spec
+        assert apply_updates(spec, spec, copy_spec=False) == _sample_spec()
+
+    def test_merge_skips_shared_subtrees(self):
+        """Subtrees the fragment shares with the spec are left as they are."""
+        spec = _sample_spec()
+        responses = spec["paths"]["/users"]["get"]["responses"]
+        fragment = {"paths": {"/users": {"get": {"responses": responses, "summary": "List"}}}}
+
+        apply_updates(spec, fragment, copy_spec=False)
+
+        assert spec["paths"]["/users"]["get"]["responses"] is responses
+        assert spec["paths"]["/users"]["get"]["summary"] == "List"
+
+    def test_merge_shared_subtrees_into_copy(self):
+        """Subtrees shared with the original are kept as the copy holds them."""
+        spec = _sample_spec()
+        responses = spec["paths"]["/users"]["get"]["responses"]
+        fragment = {"paths": {"/users": {"get": {"responses": responses, "summary": "List"}}}}
+
+        updated = apply_updates(spec, fragment)
+
+        assert updated["paths"]["/users"]["get"]["responses"] == responses
+        assert updated["paths"]["/users"]["get"]["responses"] is not responses
+        assert updated["paths"]["/users"]["get"]["summary"] == "List"
+
+        # Once an earlier update has changed the copy, shared subtrees merge again
+        updates = [
+            ("paths./users.get.responses.200", {"description": "Users"}),
+            (None, fragment),
+        ]
+        assert apply_updates_batch(spec, updates)["paths"]["/users"]["get"]["responses"] == {
+            "200": {"description": "OK"}
+        }
+
+    def test_apply_at_path(self):
+        """A fragment with a path replaces the value there."""
+        spec = _sample_spec()
+        updated = apply_updates(
+            spec, {"description": "Users"}, "paths./users.get.responses.200"
+        )
+
+        assert updated["paths"]["/users"]["get"]["responses"]["200"] == {"description": "Users"}
+        assert spec["paths"]["/users"]["get"]["responses"]["200"] == {"description": "OK"}
+
+    def test_apply_at_new_path(self):
+        """A dotted path to a missing key creates it."""
+        updated = apply_updates(_sample_spec(), {"name": "List users"}, "paths./users.get.x-meta")
+
+        assert updated["paths"]["/users"]["get"]["x-meta"] == {"name": "List users"}
+
+    def test_apply_at_jsonpath_expression(self):
+        """Real JSONPath expressions still go through jsonpath-ng."""
+        updated = apply_updates(_sample_spec(), "Users", "$..description")
+
+        assert updated["paths"]["/users"]["get"]["responses"]["200"] == {"description": "Users"}
+
+    def test_json_clone(self):
+        """Cloning through orjson gives the same result, int keys included."""
+        spec = _sample_spec()
+        yaml_style = {"paths": {"/users": {"get": {"responses": {200: {"description": "OK"}}}}}}
+
+        assert apply_updates(spec, {}, json_clone=True) == spec
+        assert apply_updates(yaml_style, {}, json_clone=True) == yaml_style
+
+    def test_batch_matches_sequential_updates(self):
+        """A batch gives the same result as applying each update in turn."""
+        updates = [
+            (None, {"info": {"title": "API"}}),
+            ("paths./users.get.responses.200", {"description": "Users"}),
+            (None, {"info": {"version": "2.0"}}),
+        ]
+        sequential = _sample_spec()
+        for json_path, fragment in updates:
+            sequential = apply_updates(sequential, fragment, json_path)
+
+        assert apply_updates_batch(_sample_spec(), updates) == sequential
+
+    def test_update_in_place(self):
+        """With copy_spec=False the given spec itself is updated."""
+        spec = _sample_spec()
+        updated = apply_updates(spec, {"info": {"title": "API"}}, copy_spec=False)
+
+        assert updated is spec
+        assert spec["info"] == {"title": "API"}
+
+    def test_compiled_paths_are_reused(self):
+        """Each path is parsed once."""
+        assert _compile_path("paths./users.get") is _compile_path("paths./users.get")
+
+
+class TestGenerateDiffOutput:
+    """Tests for the spec diff."""
+
+    def test_unified_diff(self):
+        """Changed lines are reported in order with their context."""
+        spec = _sample_spec()
+        updated = apply_updates(spec, {"description": "Users"}, "paths./users.get.responses.200")
+
+        diff = generate_diff_output(spec, updated).splitlines()
+
+        assert diff[:2] == ["--- original", "+++ updated"]
+        assert "-          description: OK" in diff
+        assert "+          description: Users" in diff
+
+    def test_in_place_update_invalidates_original_yaml(self):
+        """Updating a diffed spec in place is reflected in later diffs."""
+        spec = _sample_spec()
+        candidate = apply_updates(spec, {"info": {"title": "API"}})
+        assert "+info:" in generate_diff_output(spec, candidate).splitlines()
+
+        apply_updates(spec, {"info": {"title": "API"}}, copy_spec=False)
+
+        assert generate_diff_output(spec, candidate) == "No changes detected"
+
+    def test_spec_mutated_directly_is_diffed_as_it_is(self):
+        """A spec changed in place after a diff is rendered again."""
+        spec = _sample_spec()
+        spec["info"] = {"title": "a"}
+        updated = apply_updates(spec, {"info": {"title": "b"}})
+        assert "+  title: b" in generate_diff_output(spec, updated).splitlines()
+
+        spec["info"]["title"] = "b"
+
+        assert generate_diff_output(spec, updated) == "No changes detected"
+
+    def test_unchanged_sections_reuse_yaml(self):
+        """Sections rendered for an earlier diff give the same document."""
+        spec = _sample_spec()
+        first = apply_updates(spec, {"info": {"title": "API"}})
+        second = apply_updates(first, {"description": "Users"}, "paths./users.get.responses.200")
+
+        generate_diff_output(spec, first)
+        diff = generate_diff_output(first, second).splitlines()
+
+        assert _sectioned_yaml_lines(second) == spec_to_yaml(second).splitlines()
+        assert "+          description: Users" in diff
+        assert not any(line.startswith(("+info", "-info")) for line in diff)
+
+    def test_sections_share_nothing_between_specs(self):
+        """Shared objects and integer keys do not change the diff."""
+        schema = {"type": "string"}
+        spec = _sample_spec()
+        spec["paths"]["/users"]["get"]["x-schema"] = schema
+        spec["paths"]["/users"]["post"] = {"x-schema": schema}
+        updated = apply_updates(spec, {"info": {"title": "API"}})
+
+        diff = generate_diff_output(spec, updated).splitlines()
+
+        assert [line for line in diff if line.startswith(("+", "-"))] == [
+            "--- original", "+++ updated", "+info:", "+  title: API"
+        ]
+        # The schema is written out at both places, as in the copy
+        assert not any("id001" in line for line in diff)
+
+        yaml_style = {"paths": {"/users": {"get": {"responses": {200: {"description": "OK"}}}}}}
+        assert _sectioned_yaml_lines(yaml_style) == spec_to_yaml(yaml_style).splitlines()
+
+    def test_no_changes(self):
+        """Identical specs produce no diff."""
+        assert generate_diff_output(_sample_spec(), _sample_spec()) == "No changes detected"
+
+
+class TestSpecToYaml:
+    """Tests for YAML output."""
+
+    def test_stream_matches_string(self):
+        """Streaming writes the same document as spec_to_yaml()."""
+        spec = _sample_spec()
+        stream = io.StringIO()
+
+        spec_to_yaml_stream(spec, stream)
+
+        assert stream.getvalue() == spec_to_yaml(spec)
+        assert spec_to_yaml(spec).startswith("openapi: 3.0.0\npaths:\n")
+
+
+class TestFastJsonClone:
+    """Tests for the JSON-shaped deep copy."""
+
+    def test_clone_is_deep(self):
+        """Containers are copied at every level; scalars are shared."""
+        spec = _sample_spec()
+        spec["tags"] = [{"name": "users"}, "x", 1, 2.5, True, None]
+
+        clone = _fast_json_clone(spec)
+
+        assert clone == spec
+        assert clone["paths"]["/users"] is not spec["paths"]["/users"]
+        assert clone["tags"][0] is not spec["tags"][0]